@@ -1,16 +1,30 @@
 import os
 import io
-import tempfile
+import re
+import sys
+import asyncio
+import codecs
+import gzip
+import hashlib
+import json
+import time
 import logging
+import multiprocessing
+import threading
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Any
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, Request, Form
-from fastapi.responses import Response, HTMLResponse, FileResponse
+from fastapi.responses import Response, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from starlette.formparsers import MultiPartParser
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -35,17 +49,114 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 MAX_FILE_SIZE = int(os.getenv("MAX_FILE_SIZE", 1048576))
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Accepted upload extensions; also used to strip the extension for titles and download names
+_EXT_RE = re.compile(r'\.(md|txt)$', re.IGNORECASE)
+# C0 control characters that never appear in Markdown/plain text (tab, LF, FF and CR are allowed)
+_BINARY_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0e-\x1f]')
+# Allowance for multipart boundaries, part headers and the small form fields
+MULTIPART_OVERHEAD = 64 * 1024
+
+# Keep uploaded file parts in memory up to the upload limit; Starlette's default spool
+# rolls over to a temporary file on disk at 1 MB, right at our default MAX_FILE_SIZE.
+# Older Starlette releases call the threshold max_file_size; leave it alone if neither
+# exists (request.form() has no per-request spool setting to use instead).
+for _spool_attr in ("spool_max_size", "max_file_size"):
+    if isinstance(getattr(MultiPartParser, _spool_attr, None), int):
+        setattr(MultiPartParser, _spool_attr, max(getattr(MultiPartParser, _spool_attr), MAX_FILE_SIZE + MULTIPART_OVERHEAD))
+        break
 RATE_LIMIT = os.getenv("RATE_LIMIT", "5/minute")
-
-limiter = Limiter(key_func=get_remote_address)
+# memory:// is per-process; use e.g. redis://host:6379 so counters are shared across workers
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+PARSE_CACHE_SIZE = int(os.getenv("PARSE_CACHE_SIZE", 128))
+PDF_CACHE_SIZE = int(os.getenv("PDF_CACHE_SIZE", 64))
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", os.cpu_count() or 1))
+
+# PDF rendering is CPU-bound, so it runs in worker processes to keep the event loop free.
+# Started with the app (or on first use when no lifespan runs); each worker process keeps
+# its own parse cache. Workers come from a forkserver (spawn where unavailable) rather
+# than forking the running, threaded server.
+_process_pool: Optional[ProcessPoolExecutor] = None
+_POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=PDF_WORKERS,
+                                            mp_context=multiprocessing.get_context(_POOL_START_METHOD))
+    return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop pool if it is still the current one, so the next call starts a fresh pool."""
+    global _process_pool
+    if _process_pool is pool:
+        _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_process_pool(func, *args):
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # A worker died (OOM kill, native crash); replace the pool and retry once
+        logger.warning("Process pool broken; restarting it and retrying %s", getattr(func, "__name__", func))
+        _discard_process_pool(pool)
+        return await loop.run_in_executor(get_process_pool(), func, *args)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_process_pool()
+    yield
+    if _process_pool is not None:
+        _discard_process_pool(_process_pool)
+
+
+# Fixed windows are a single counter increment per request (per-key locking in limits'
+# memory storage), cheaper than the moving-window event lists.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=RATE_LIMIT_STORAGE_URI,
+    strategy="fixed-window"
+)
 app = FastAPI(
     title="ScriptMD2PDF API",
     description="Convert screenplay-flavored Markdown to PDF",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+
+class UploadSizeLimitMiddleware:
+    """Refuse a request to `path` whose declared body size is over max_bytes before the
+    multipart form is parsed. Plain ASGI, so other paths pass straight through."""
+
+    def __init__(self, app, path: str, max_bytes: int):
+        self.app = app
+        self.path = path
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == self.path:
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > self.max_bytes:
+                        response = JSONResponse(status_code=413, content={"detail": f"File size exceeds {MAX_FILE_SIZE} bytes"})
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+# Added before CORS so it runs inside it and its 413 still carries CORS headers
+app.add_middleware(UploadSizeLimitMiddleware, path="/convert", max_bytes=MAX_FILE_SIZE + MULTIPART_OVERHEAD)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -71,14 +182,8 @@ class ConvertRequest(BaseModel):
     fcpxml: bool = Field(False)
 
 
-@app.get("/")
-async def index():
-    """Serve the main HTML page."""
-    index_file = Path(__file__).parent / "static" / "index.html"
-    if index_file.exists():
-        return FileResponse(index_file)
-    # Fallback for development
-    return HTMLResponse(content="""
+# Fallback page for development when static/index.html is missing
+FALLBACK_INDEX_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -656,15 +761,82 @@ Alex works at the laptop.</code></pre>
     </script>
 </body>
 </html>
-    """)
+"""
+
+
+def _load_index_bytes() -> bytes:
+    index_file = Path(__file__).parent / "static" / "index.html"
+    if index_file.exists():
+        return index_file.read_bytes()
+    return FALLBACK_INDEX_HTML.encode("utf-8")
+
+
+# The index page is static, so encode, compress and compute its ETags once; restart to pick up edits.
+_INDEX_BYTES = _load_index_bytes()
+_INDEX_GZIP = gzip.compress(_INDEX_BYTES, 9)
+_INDEX_ETAG = f'"{hashlib.md5(_INDEX_BYTES).hexdigest()}"'
+_INDEX_HEADERS = {"ETag": _INDEX_ETAG, "Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+_INDEX_GZIP_HEADERS = {**_INDEX_HEADERS, "ETag": _INDEX_ETAG[:-1] + '-gzip"', "Content-Encoding": "gzip"}
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """True when Accept-Encoding allows gzip, explicitly or via *, with a non-zero q-value."""
+    q_values = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        q_values[coding.strip().lower()] = q
+    q = q_values.get("gzip", q_values.get("x-gzip", q_values.get("*", 0.0)))
+    return q > 0
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison: * or any listed tag, ignoring a W/ prefix."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+@app.get("/")
+async def index(request: Request):
+    """Serve the main HTML page from the bytes prepared at import time."""
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        body, headers = _INDEX_GZIP, _INDEX_GZIP_HEADERS
+    else:
+        body, headers = _INDEX_BYTES, _INDEX_HEADERS
+    if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/html", headers=headers)
 
 
-# Removed large HTML content - now served from static/index.html
+# (second, encoded body) of the last /health response; probes within the same
+# second reuse the body instead of formatting a timestamp and encoding JSON again
+_health_body: tuple[int, bytes] = (-1, b"")
 
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    global _health_body
+    sec = int(time.time())
+    cached_sec, body = _health_body
+    if sec != cached_sec:
+        body = json.dumps({"status": "healthy", "timestamp": datetime.fromtimestamp(sec).isoformat()}).encode()
+        _health_body = (sec, body)
+    return Response(content=body, media_type="application/json")
+
+
+# /convert-text always uses the same download names, so its headers are built once
+_TEXT_PDF_HEADERS = {"Content-Disposition": 'attachment; filename="screenplay.pdf"'}
+_TEXT_ZIP_HEADERS = {"Content-Disposition": 'attachment; filename="screenplay-exports.zip"'}
 
 
 @app.post("/convert")
@@ -682,21 +854,18 @@ async def convert_file(
 ):
     logger.info(f"Conversion request from {get_remote_address(request)}: {file.filename}")
 
-    if not file.filename.endswith(('.md', '.txt')):
+    # Ignore any client-side directories, like Path.stem does; then one regex pass both
+    # validates the extension and locates where the stem ends
+    name = Path(file.filename).name
+    ext_match = _EXT_RE.search(name)
+    if not ext_match:
         raise HTTPException(status_code=400, detail="Only .md or .txt files are allowed")
+    stem = name[:ext_match.start()]
 
-    content = await file.read()
-
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=413, detail=f"File size exceeds {MAX_FILE_SIZE} bytes")
-
-    try:
-        markdown_text = content.decode('utf-8')
-    except UnicodeDecodeError:
-        raise HTTPException(status_code=400, detail="Invalid UTF-8 encoding")
+    markdown_text = await read_upload_text(file)
 
     if not title:
-        title = Path(file.filename).stem.replace('_', ' ').title()
+        title = stem.replace('_', ' ').title()
 
     try:
         # Check if we need multiple outputs
@@ -704,31 +873,32 @@ async def convert_file(
 
         if has_additional_exports:
             # Generate all files and return as ZIP
-            zip_bytes = generate_all_exports(
+            zip_bytes = await run_in_process_pool(
+                generate_all_exports,
                 markdown_text, title, font_size, use_vector,
                 shot_list, shot_list_pdf, entities, fcpxml
             )
 
             logger.info(f"Successfully generated exports for {file.filename}")
 
-            return Response(
+            return download_response(
                 content=zip_bytes,
                 media_type="application/zip",
                 headers={
-                    "Content-Disposition": f'attachment; filename="{Path(file.filename).stem}-exports.zip"'
+                    "Content-Disposition": f'attachment; filename="{stem}-exports.zip"'
                 }
             )
         else:
             # Just generate PDF
-            pdf_bytes = generate_pdf(markdown_text, title, font_size, use_vector)
+            pdf_bytes = await generate_pdf_cached(markdown_text, title, font_size, use_vector)
 
             logger.info(f"Successfully generated PDF for {file.filename}")
 
-            return Response(
+            return download_response(
                 content=pdf_bytes,
                 media_type="application/pdf",
                 headers={
-                    "Content-Disposition": f'attachment; filename="{Path(file.filename).stem}.pdf"'
+                    "Content-Disposition": f'attachment; filename="{stem}.pdf"'
                 }
             )
     except Exception as e:
@@ -736,6 +906,51 @@ async def convert_file(
         raise HTTPException(status_code=500, detail="Failed to generate exports")
 
 
+# Downloads larger than this are streamed in DOWNLOAD_CHUNK_SIZE pieces so the client starts
+# receiving while the rest is written; small ones go out in a single body message.
+STREAM_THRESHOLD = 256 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def download_response(content: bytes, media_type: str, headers: Dict[str, str]) -> Response:
+    """Return generated file bytes, streaming them in chunks when they are large."""
+    if len(content) <= STREAM_THRESHOLD:
+        return Response(content=content, media_type=media_type, headers=headers)
+
+    async def iter_chunks():
+        # Async generator so Starlette doesn't hop to the threadpool for every chunk
+        for start in range(0, len(content), DOWNLOAD_CHUNK_SIZE):
+            yield content[start:start + DOWNLOAD_CHUNK_SIZE]
+
+    # StreamingResponse doesn't know the size up front; keep Content-Length for progress bars
+    headers = {**headers, "Content-Length": str(len(content))}
+    return StreamingResponse(iter_chunks(), media_type=media_type, headers=headers)
+
+
+async def read_upload_text(file: UploadFile) -> str:
+    """Read an upload in chunks, rejecting it as soon as it exceeds MAX_FILE_SIZE.
+
+    Chunks are decoded as they arrive, so the raw bytes are never held alongside the text.
+    Each decoded chunk is scanned for control characters so binary files are refused early.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    parts: List[str] = []
+    total = 0
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            total += len(chunk)
+            if total > MAX_FILE_SIZE:
+                raise HTTPException(status_code=413, detail=f"File size exceeds {MAX_FILE_SIZE} bytes")
+            text = decoder.decode(chunk)
+            if _BINARY_CHARS_RE.search(text):
+                raise HTTPException(status_code=400, detail="File appears to be binary, not text")
+            parts.append(text)
+        parts.append(decoder.decode(b'', final=True))
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid UTF-8 encoding")
+    return ''.join(parts)
+
+
 @app.post("/convert-text")
 @limiter.limit(RATE_LIMIT)
 async def convert_text(request: Request, data: ConvertRequest):
@@ -749,80 +964,138 @@ async def convert_text(request: Request, data: ConvertRequest):
 
         if has_additional_exports:
             # Generate all files and return as ZIP
-            zip_bytes = generate_all_exports(
+            zip_bytes = await run_in_process_pool(
+                generate_all_exports,
                 data.markdown, title, data.font_size, data.use_vector,
                 data.shot_list, data.shot_list_pdf, data.entities, data.fcpxml
             )
 
             logger.info(f"Successfully generated exports from text input")
 
-            return Response(
+            return download_response(
                 content=zip_bytes,
                 media_type="application/zip",
-                headers={
-                    "Content-Disposition": 'attachment; filename="screenplay-exports.zip"'
-                }
+                headers=_TEXT_ZIP_HEADERS
             )
         else:
             # Just generate PDF
-            pdf_bytes = generate_pdf(data.markdown, title, data.font_size, data.use_vector)
+            pdf_bytes = await generate_pdf_cached(data.markdown, title, data.font_size, data.use_vector)
 
             logger.info(f"Successfully generated PDF from text input")
 
-            return Response(
+            return download_response(
                 content=pdf_bytes,
                 media_type="application/pdf",
-                headers={
-                    "Content-Disposition": 'attachment; filename="screenplay.pdf"'
-                }
+                headers=_TEXT_PDF_HEADERS
             )
     except Exception as e:
         logger.error(f"Error generating exports: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to generate exports")
 
 
-def generate_pdf(markdown_text: str, title: str, font_size: int, use_vector: bool) -> bytes:
+# Parsed elements keyed by markdown digest. Renderers only read the element
+# dicts, so cached lists are shared between requests without copying.
+_parse_cache: "OrderedDict[bytes, List[Dict[str, Any]]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def parse_markdown_cached(markdown_text: str) -> List[Dict[str, Any]]:
+    """Parse markdown, reusing the result for identical inputs (LRU, PARSE_CACHE_SIZE entries)."""
+    key = hashlib.blake2b(markdown_text.encode('utf-8'), digest_size=16).digest()
+    with _parse_cache_lock:
+        elements = _parse_cache.get(key)
+        if elements is not None:
+            _parse_cache.move_to_end(key)
+            return elements
+
     elements = parse_screenplay_markdown(markdown_text)
 
+    with _parse_cache_lock:
+        _parse_cache[key] = elements
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return elements
+
+
+def generate_pdf(markdown_text: str, title: str, font_size: int, use_vector: bool) -> bytes:
+    elements = parse_markdown_cached(markdown_text)
+
     if not elements:
         raise ValueError("No valid screenplay elements found in markdown")
 
-    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-        tmp_path = tmp_file.name
-
-    try:
-        if use_vector:
-            try:
-                draw_pdf_vector(
-                    elements,
-                    tmp_path,
-                    title=title,
-                    font_size=font_size
-                )
-            except (ImportError, SystemExit):
-                logger.warning("ReportLab not available, falling back to raster rendering")
-                draw_pdf(
-                    elements,
-                    tmp_path,
-                    title=title,
-                    font_size=font_size
-                )
-        else:
+    buf = io.BytesIO()
+    if use_vector:
+        try:
+            draw_pdf_vector(
+                elements,
+                buf,
+                title=title,
+                font_size=font_size
+            )
+        except ImportError:
+            logger.warning("ReportLab not available, falling back to raster rendering")
+            buf = io.BytesIO()
             draw_pdf(
                 elements,
-                tmp_path,
+                buf,
                 title=title,
                 font_size=font_size
             )
+    else:
+        draw_pdf(
+            elements,
+            buf,
+            title=title,
+            font_size=font_size
+        )
+
+    return buf.getvalue()
+
+
+# Rendered PDFs keyed by all generate_pdf inputs. Lives in the server process (the
+# worker pool has no shared memory), bounded by entry count and total bytes.
+_pdf_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+_pdf_cache_bytes = 0
+_pdf_cache_lock = threading.Lock()
+
+
+def _pdf_cache_key(markdown_text: str, title: str, font_size: int, use_vector: bool) -> bytes:
+    digest = hashlib.blake2b(markdown_text.encode('utf-8'), digest_size=16).digest()
+    return digest + f"{font_size}:{int(use_vector)}:{title}".encode('utf-8')
 
-        with open(tmp_path, 'rb') as f:
-            pdf_bytes = f.read()
 
+def _pdf_cache_get(key: bytes) -> Optional[bytes]:
+    with _pdf_cache_lock:
+        pdf_bytes = _pdf_cache.get(key)
+        if pdf_bytes is not None:
+            _pdf_cache.move_to_end(key)
         return pdf_bytes
 
-    finally:
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+
+def _pdf_cache_put(key: bytes, pdf_bytes: bytes) -> None:
+    global _pdf_cache_bytes
+    if len(pdf_bytes) > PDF_CACHE_MAX_BYTES:
+        return
+    with _pdf_cache_lock:
+        previous = _pdf_cache.pop(key, None)
+        if previous is not None:
+            _pdf_cache_bytes -= len(previous)
+        _pdf_cache[key] = pdf_bytes
+        _pdf_cache_bytes += len(pdf_bytes)
+        while len(_pdf_cache) > PDF_CACHE_SIZE or _pdf_cache_bytes > PDF_CACHE_MAX_BYTES:
+            _, evicted = _pdf_cache.popitem(last=False)
+            _pdf_cache_bytes -= len(evicted)
+
+
+async def generate_pdf_cached(markdown_text: str, title: str, font_size: int, use_vector: bool) -> bytes:
+    """Return the PDF for these inputs, rendering in the process pool only on a cache miss."""
+    key = _pdf_cache_key(markdown_text, title, font_size, use_vector)
+    pdf_bytes = _pdf_cache_get(key)
+    if pdf_bytes is None:
+        pdf_bytes = await run_in_process_pool(generate_pdf, markdown_text, title, font_size, use_vector)
+        _pdf_cache_put(key, pdf_bytes)
+    return pdf_bytes
 
 
 def generate_all_exports(
@@ -836,7 +1109,7 @@ def generate_all_exports(
     fcpxml: bool
 ) -> bytes:
     """Generate all requested exports and package them in a ZIP file."""
-    elements = parse_screenplay_markdown(markdown_text)
+    elements = parse_markdown_cached(markdown_text)
 
     if not elements:
         raise ValueError("No valid screenplay elements found in markdown")
@@ -851,53 +1124,36 @@ def generate_all_exports(
 
         # Shot list CSV
         if shot_list:
-            with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as tmp:
-                tmp_path = tmp.name
-            try:
-                write_shot_list(elements, tmp_path, include_entities=entities)
-                with open(tmp_path, 'rb') as f:
-                    zip_file.writestr(f"{title}-shotlist.csv", f.read())
-            finally:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+            csv_buf = io.StringIO()
+            write_shot_list(elements, csv_buf, include_entities=entities, fmt="csv")
+            zip_file.writestr(f"{title}-shotlist.csv", csv_buf.getvalue())
 
         # Shot list PDF
         if shot_list_pdf:
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-                tmp_path = tmp.name
+            rows, ents = build_shot_list(elements, include_entities=entities)
+            shot_pdf_buf = io.BytesIO()
             try:
-                rows, ents = build_shot_list(elements, include_entities=entities)
-                try:
-                    render_shot_list_pdf_vector(
-                        rows, ents, tmp_path,
-                        font_size=font_size,
-                        title=f"{title} - Shot List",
-                        include_entities=entities
-                    )
-                except (ImportError, RuntimeError):
-                    render_shot_list_pdf(
-                        rows, ents, tmp_path,
-                        font_size=font_size,
-                        title=f"{title} - Shot List",
-                        include_entities=entities
-                    )
-                with open(tmp_path, 'rb') as f:
-                    zip_file.writestr(f"{title}-shotlist.pdf", f.read())
-            finally:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+                render_shot_list_pdf_vector(
+                    rows, ents, shot_pdf_buf,
+                    font_size=font_size,
+                    title=f"{title} - Shot List",
+                    include_entities=entities
+                )
+            except (ImportError, RuntimeError):
+                shot_pdf_buf = io.BytesIO()
+                render_shot_list_pdf(
+                    rows, ents, shot_pdf_buf,
+                    font_size=font_size,
+                    title=f"{title} - Shot List",
+                    include_entities=entities
+                )
+            zip_file.writestr(f"{title}-shotlist.pdf", shot_pdf_buf.getvalue())
 
         # FCPXML
         if fcpxml:
-            with tempfile.NamedTemporaryFile(suffix='.fcpxml', delete=False) as tmp:
-                tmp_path = tmp.name
-            try:
-                write_fcpxml(elements, tmp_path, title=title)
-                with open(tmp_path, 'rb') as f:
-                    zip_file.writestr(f"{title}.fcpxml", f.read())
-            finally:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+            fcpxml_buf = io.StringIO()
+            write_fcpxml(elements, fcpxml_buf, title=title)
+            zip_file.writestr(f"{title}.fcpxml", fcpxml_buf.getvalue())
 
     # Get the ZIP file bytes
     zip_buffer.seek(0)
@@ -907,10 +1163,17 @@ def generate_all_exports(
 if __name__ == "__main__":
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", 8000))
+    # Each worker is a separate process with its own event loop, PDF pool, caches and
+    # (with memory://) rate-limit counters; size WORKERS * PDF_WORKERS to the CPU count.
+    # Uvicorn ignores workers when reload is enabled.
+    workers = int(os.getenv("WORKERS", 1))
 
     uvicorn.run(
         "app:app",
         host=host,
         port=port,
+        workers=workers,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
         reload=os.getenv("RELOAD", "false").lower() == "true"
     )
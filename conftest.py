@@ -0,0 +1,98 @@
+import pytest
+from screenmd2pdf import parse_screenplay_markdown, find_mono_font, load_font
+
+# Parsed once per session; the renderers and exporters only read elements,
+# so tests must not mutate these lists.
+
+SIMPLE_MD = "### INT. TEST - DAY\n\nTest action."
+
+TWO_SCENE_MD = """### INT. KITCHEN - DAY
+
+Making breakfast.
+
+### EXT. GARDEN - DAY
+
+Walking through flowers.
+"""
+
+SHOT_MD = """### INT. ROOM - DAY
+
+! CLOSE ON
+
+A detail shot.
+"""
+
+DIALOG_MD = """### INT. ROOM - DAY
+
+@ALEX
+Hello.
+
+@JORDAN
+Hi there.
+
+@ALEX
+How are you?
+"""
+
+COMPLEX_MD = """### INT. COFFEE SHOP - DAY
+
+The morning rush is in full swing.
+
+@ALEX
+(to barista)
+Large coffee, please.
+
+>> CUT TO:
+
+! CLOSE ON - COFFEE CUP
+
+Steam rises from the cup.
+"""
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_font_cache():
+    # The parser's regexes compile at import; the FreeType load is the only
+    # cold start left, so pay it before any test's clock starts.
+    find_mono_font()
+    load_font()
+
+
+@pytest.fixture(scope="session")
+def simple_elements():
+    return parse_screenplay_markdown(SIMPLE_MD)
+
+
+@pytest.fixture(scope="session")
+def two_scene_elements():
+    return parse_screenplay_markdown(TWO_SCENE_MD)
+
+
+@pytest.fixture(scope="session")
+def shot_elements():
+    return parse_screenplay_markdown(SHOT_MD)
+
+
+@pytest.fixture(scope="session")
+def dialog_elements():
+    return parse_screenplay_markdown(DIALOG_MD)
+
+
+@pytest.fixture(scope="session")
+def complex_md():
+    return COMPLEX_MD
+
+
+@pytest.fixture(scope="session")
+def complex_elements(complex_md):
+    return parse_screenplay_markdown(complex_md)
+
+
+@pytest.fixture(scope="session")
+def mono_font_path():
+    return find_mono_font()
+
+
+@pytest.fixture
+def tmp_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("smd")
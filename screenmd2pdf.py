@@ -40,10 +40,19 @@ text measurement isn't available in your Pillow build. It also supports --font a
 
 import os
 import argparse
-from PIL import Image, ImageDraw, ImageFont
-from typing import List, Dict, Any
+import contextlib
+import functools
+from typing import TYPE_CHECKING, List, Dict, Any, BinaryIO, TextIO
 import re
 
+# Pillow is imported inside the raster/font functions so that parsing, shot lists and
+# exports (and vector-only rendering) don't pay for importing it
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Font lookups stat several candidate paths and FreeType re-parses the TTF on every load;
+# fonts are only read, so each (path, size) is loaded once per process and shared.
+@functools.lru_cache(maxsize=1)
 def find_mono_font():
     candidates = [
         "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
@@ -58,7 +67,9 @@ def find_mono_font():
             return path
     return None
 
+@functools.lru_cache(maxsize=16)
 def load_font(size=12, override_path=None):
+    from PIL import ImageFont
     if override_path and os.path.exists(override_path):
         try:
             return ImageFont.truetype(override_path, size=size)
@@ -72,12 +83,27 @@ def load_font(size=12, override_path=None):
             pass
     return ImageFont.load_default()
 
+@functools.lru_cache(maxsize=16)
+def font_metrics(font) -> tuple[int, int] | None:
+    """(ascent, descent) of a loaded font, cached like the fonts themselves; None if unavailable."""
+    try:
+        return font.getmetrics()  # type: ignore[attr-defined]
+    except AttributeError:
+        return None
+
 def load_bold_variant(base_font, base_path: str | None, size: int):  # type: ignore[override]
     """Attempt to load a bold variant of the provided font. Fall back to base_font.
     Heuristics: if a path was supplied or discovered, try common Bold filename patterns.
     """
+    bold = _load_bold_font(base_path, size)
+    return bold if bold is not None else base_font
+
+@functools.lru_cache(maxsize=16)
+def _load_bold_font(base_path: str | None, size: int):
+    """Cached bold sibling lookup for load_bold_variant; None when there isn't one."""
+    from PIL import ImageFont
     if not base_path or not os.path.exists(base_path):
-        return base_font
+        return None
     candidates = []
     root, ext = os.path.splitext(base_path)
     # Common replacements
@@ -101,283 +127,420 @@ def load_bold_variant(base_font, base_path: str | None, size: int):  # type: ign
                 return ImageFont.truetype(c, size=size)
             except OSError:  # specific to font loading
                 continue
-    return base_font
+    return None
 
 # Types:
-# - scene: {"type":"scene","text":...}
+# - scene: {"type":"scene","text":...} (case kept as written; renderers uppercase it)
 # - action: {"type":"action","text":...}
-# - dialogue: {"type":"dialogue","character":..., "parentheticals":[...], "lines":[...]} (lines are strings combined)
-# - transition: {"type":"transition","text":...}
-# - shot: {"type":"shot","text":...}
+# - dialogue: {"type":"dialogue","character":..., "parentheticals":[...], "lines":[...]} (lines are strings combined; character uppercased)
+# - transition: {"type":"transition","text":...} (uppercased, ends with ':')
+# - shot: {"type":"shot","text":...} (uppercased)
 # - pagebreak: {"type":"pagebreak"}
 
+# Block markers, tried in one pass: '#'-'###' scene headings, '>>' transitions, other '>'
+# notes (dropped), '!' shots and '@' character cues. Anything else is action.
+_BLOCK_RE = re.compile(r'(?P<scene>#{1,3} )|(?P<transition>>> )|(?P<note>>)|(?P<shot>! )|(?P<dialogue>@)')
+
+def _block_body(lines: List[str], end: int) -> str:
+    """Block text after its marker; single-line blocks (the usual case) skip the join."""
+    if len(lines) == 1:
+        return lines[0][end:]
+    return "\n".join(lines)[end:]
+
+def _scene_block(lines: List[str], end: int) -> Dict[str, Any]:
+    return {"type": "scene", "text": _block_body(lines, end).strip()}
+
+def _transition_block(lines: List[str], end: int) -> Dict[str, Any]:
+    text = _block_body(lines, end).strip().upper()
+    if not text.endswith(":"):
+        text += ":"
+    return {"type": "transition", "text": text}
+
+def _note_block(lines: List[str], end: int) -> None:
+    # Ignore any blockquote/note lines starting with '>'
+    return None
+
+def _shot_block(lines: List[str], end: int) -> Dict[str, Any]:
+    return {"type": "shot", "text": _block_body(lines, end).strip().upper()}
+
+def _dialogue_block(lines: List[str], end: int) -> Dict[str, Any]:
+    # First line is the '@NAME' cue, the rest parentheticals and dialogue
+    character = lines[0][end:].strip().upper()
+    parentheticals = []
+    dialogue_lines = []
+    for ln in lines[1:]:
+        st = ln.strip()
+        if st.startswith("(") and st.endswith(")"):
+            parentheticals.append(st)
+        else:
+            dialogue_lines.append(st)
+    return {
+        "type": "dialogue",
+        "character": character,
+        "parentheticals": parentheticals,
+        "lines": dialogue_lines
+    }
+
+# Action lines that act as page breaks
+_DASH_BREAK_LINES = frozenset({"-", "--", "---"})
+
+_BLOCK_HANDLERS = {
+    "scene": _scene_block,
+    "transition": _transition_block,
+    "note": _note_block,
+    "shot": _shot_block,
+    "dialogue": _dialogue_block,
+}
+
+def _append_action_text(group: List[str], elements: List[Dict[str, Any]]) -> None:
+    text = "\n".join(group).strip()
+    # Drop empty or dash-only remnants
+    if text.strip(" -\t"):
+        elements.append({"type": "action", "text": text})
+    group.clear()
+
+def _append_action(lines: List[str], elements: List[Dict[str, Any]]) -> None:
+    """Append an action block, splitting standalone dash lines into pagebreaks."""
+    group: List[str] = []
+    for ln in lines:
+        if ln.strip() in _DASH_BREAK_LINES:
+            _append_action_text(group, elements)
+            elements.append({"type": "pagebreak"})
+        else:
+            group.append(ln)
+    _append_action_text(group, elements)
+
 def parse_screenplay_markdown(md_text: str) -> List[Dict[str, Any]]:
+    # Single pass: lines accumulate into the current block, which is classified and
+    # emitted as soon as a blank line, '---' marker or end of input closes it.
+    elements: List[Dict[str, Any]] = []
+    buf: List[str] = []
+
+    def flush():
+        if not buf:
+            return
+        # The block's kind is decided by the marker (if any) on its first line
+        first = buf[0].lstrip()
+        m = _BLOCK_RE.match(first)
+        if m is None:
+            # Plain action (the bulk of most scripts)
+            _append_action(buf, elements)
+        else:
+            # Handlers get the block's lines (all non-blank and right-stripped already)
+            # rather than one joined string they would have to split again
+            buf[0] = first
+            el = _BLOCK_HANDLERS[m.lastgroup](buf, m.end())
+            if el is not None:
+                elements.append(el)
+        buf.clear()
+
+    # The block buffer is reused (cleared, never rebound), so its append can be bound once
+    buf_append = buf.append
     # Normalize real newlines (previous version used escaped sequences incorrectly)
-    lines = md_text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
-
-    blocks = []
-    buf = []
-    for raw in lines:
-        line = raw.rstrip()
-        stripped_line = line.lstrip()
+    for raw in md_text.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        stripped_line = raw.strip()
+        # Blank lines end the current block; check them before any prefix tests
+        if not stripped_line:
+            flush()
+            continue
+        lead = stripped_line[0]
         # Skip comments
-        if stripped_line.startswith("//"):
+        if lead == "/" and stripped_line.startswith("//"):
             continue
         # Skip blockquotes/notes (lines starting with '>' that are NOT transitions).
         # Keep transitions that start with '>>'.
-        if stripped_line.startswith(">") and not stripped_line.startswith(">>"):
-            continue
-        if stripped_line == "---":
-            if buf:
-                blocks.append("\n".join(buf).strip("\n"))
-                buf = []
-            blocks.append("---")
+        if lead == ">" and not stripped_line.startswith(">>"):
             continue
-        if stripped_line == "":
-            if buf:
-                blocks.append("\n".join(buf).strip("\n"))
-                buf = []
-        else:
-            buf.append(line)
-    if buf:
-        blocks.append("\n".join(buf).strip("\n"))
-
-    # Fix: re-split all blocks on real newlines for further parsing
-    fixed_blocks = []
-    for block in blocks:
-        if block == "---":
-            fixed_blocks.append(block)
-        else:
-            fixed_blocks.extend(block.split("\n\n"))
-    blocks = fixed_blocks
-
-    elements: List[Dict[str, Any]] = []
-    for block in blocks:
-        # Always treat a block that is exactly '---' as a pagebreak/horizontal line
-        if block.strip() == "---":
+        # Always treat a line that is exactly '---' as a pagebreak/horizontal line
+        if lead == "-" and stripped_line == "---":
+            flush()
             elements.append({"type": "pagebreak"})
             continue
+        # Indentation of continuation lines is kept in the element text
+        buf_append(raw.rstrip())
+    flush()
+    return elements
 
-        stripped = block.strip()
-        # Remove markdown heading markers for all block types
-        if stripped.startswith("### "):
-            text = stripped[4:].strip()
-            elements.append({"type": "scene", "text": text})
-            continue
-        if stripped.startswith("## "):
-            text = stripped[3:].strip()
-            elements.append({"type": "scene", "text": text})
-            continue
-        if stripped.startswith("# "):
-            text = stripped[2:].strip()
-            elements.append({"type": "scene", "text": text})
-            continue
-        if stripped.startswith(">> "):
-            text = stripped[3:].strip().upper()
-            if not text.endswith(":"):
-                text += ":"
-            elements.append({"type": "transition", "text": text})
-            continue
-        # Ignore any blockquote/note lines starting with '>' (with or without leading spaces)
-        if stripped.startswith("> ") or stripped.startswith(">"):
+def _wrap_monospace(raw_line: str, max_chars: int) -> List[str]:
+    """Word-wrap one line by character count for a monospace font.
+
+    Same greedy rules as the measured wrappers in the renderers: a line that fits is kept
+    as-is, otherwise words are re-joined with single spaces and over-long words are
+    hard-wrapped into max_chars pieces.
+    """
+    if len(raw_line) <= max_chars:
+        return [raw_line]
+    words = raw_line.split()
+    if not words:
+        return [""]
+    step = max(max_chars, 1)
+    lines_out: List[str] = []
+    line = ""
+    for w in words:
+        if not line:
+            if len(w) <= max_chars:
+                line = w
+                continue
+        elif len(line) + 1 + len(w) <= max_chars:
+            line = line + " " + w
             continue
-        if stripped.startswith("! "):
-            text = stripped[2:].strip().upper()
-            elements.append({"type": "shot", "text": text})
+        if line:
+            lines_out.append(line)
+        if len(w) > max_chars:
+            pieces = [w[i:i+step] for i in range(0, len(w), step)]
+            lines_out.extend(pieces[:-1])
+            line = pieces[-1]
+        else:
+            line = w
+    if line:
+        lines_out.append(line)
+    return lines_out
+
+def _wrap_measured(raw_line: str, max_width: float, width) -> List[str]:
+    """Word-wrap one line that is wider than max_width using a width(str) measure.
+
+    Each word (and the space) is measured once and line widths are accumulated, instead
+    of re-measuring the growing line for every word. Over-long words are hard-wrapped
+    by accumulating character widths the same way.
+    """
+    words = raw_line.split()
+    if not words:
+        return [""]
+    # Summed widths drift from a single measurement by float rounding; without a little
+    # slack a line that exactly fills the column (common with monospace) would break early
+    max_width += 1e-6
+    space_w = width(" ")
+    lines_out: List[str] = []
+    line = ""
+    line_w = 0.0
+    for w in words:
+        w_w = width(w)
+        test_w = w_w if not line else line_w + space_w + w_w
+        if test_w <= max_width:
+            line = w if not line else line + " " + w
+            line_w = test_w
             continue
-        if stripped.lstrip().startswith("@"):
-            lines = [ln for ln in stripped.split("\n")]
-            # Remove leading spaces and @ for character cue, then strip and uppercase
-            char_line = lines[0].lstrip()
-            if char_line.startswith("@"):
-                character = char_line[1:].strip().upper()
-            else:
-                character = char_line.strip().upper()
-            parentheticals = []
-            dialogue_lines = []
-            for ln in lines[1:]:
-                st = ln.strip()
-                if st.startswith("(") and st.endswith(")"):
-                    parentheticals.append(st)
+        if line:
+            lines_out.append(line)
+        if w_w > max_width:
+            chunk = ""
+            chunk_w = 0.0
+            for ch in w:
+                ch_w = width(ch)
+                if chunk_w + ch_w <= max_width:
+                    chunk += ch
+                    chunk_w += ch_w
                 else:
-                    dialogue_lines.append(st)
-            elements.append({
-                "type": "dialogue",
-                "character": character,
-                "parentheticals": parentheticals,
-                "lines": dialogue_lines
-            })
-            continue
-        # Remove any leading markdown heading or control characters from action blocks
-        cleaned = stripped
-        for prefix in ["# ", "## ", "### ", "! ", ">> ", "> "]:
-            if cleaned.startswith(prefix):
-                cleaned = cleaned[len(prefix):].strip()
-        # Do not add an action block if it is just '---' (with or without whitespace)
-        if cleaned.strip() == "---":
-            continue
-        elements.append({"type": "action", "text": cleaned})
-    # Post-process: split any action blocks that contain standalone dash separators into pagebreaks
-    processed: List[Dict[str, Any]] = []
-    for el in elements:
-        if el.get("type") != "action":
-            processed.append(el)
-            continue
-        text_block = el.get("text", "")
-        lines_block = text_block.split("\n")
-        tmp_buf: List[str] = []
-        def flush_tmp(buf: List[str]):
-            if buf:
-                joined_text = "\n".join(buf).strip()
-                if joined_text:
-                    processed.append({"type": "action", "text": joined_text})
-                buf.clear()
-        for ln in lines_block:
-            if ln.strip() in {"-", "--", "---"}:
-                flush_tmp(tmp_buf)
-                processed.append({"type": "pagebreak"})
-            else:
-                tmp_buf.append(ln)
-        flush_tmp(tmp_buf)
+                    if chunk:
+                        lines_out.append(chunk)
+                    chunk = ch
+                    chunk_w = ch_w
+            line, line_w = chunk, chunk_w
+        else:
+            line, line_w = w, w_w
+    if line:
+        lines_out.append(line)
+    return lines_out
+
+def _is_plain_ascii(s: str) -> bool:
+    """True when every character is printable ASCII, i.e. one fixed advance in a mono font."""
+    return s.isascii() and s.isprintable()
+
+def _mono_advance(width) -> float:
+    """Shared glyph advance if the font behind width(str) is monospace, else 0."""
+    w = width("M")
+    # Non-positive font sizes measure <= 0; leave those to the measuring wrap
+    if w <= 0 or any(width(ch) != w for ch in "iW. "):
+        return 0.0
+    return w
+
+def _is_single_spaced(s: str) -> bool:
+    """True when " ".join(s.split()) == s, i.e. word-wrapping would not respace it."""
+    return s.isprintable() and "  " not in s and s[:1] != " " and s[-1:] != " "
+
+def _mono_fit(width, mono_w: float, max_width: float) -> int:
+    """Most plain ASCII characters that fit in max_width in a monospace font.
+
+    The estimate from the advance is settled against width(str) itself, so the count
+    agrees exactly with measuring any string of that length.
+    """
+    n = int(max_width // mono_w)
+    while n > 0 and width("M" * n) > max_width:
+        n -= 1
+    while width("M" * (n + 1)) <= max_width:
+        n += 1
+    return n
+
+def _wrap_text(text: str, max_width: float, width, mono_w: float = 0.0, mono_fits: Dict[float, int] | None = None) -> List[str]:
+    """Wrap text to max_width, honoring explicit newlines, for any renderer.
+
+    width(str) measures a string in the renderer's current font; mono_w is that font's
+    advance from _mono_advance (0 for proportional fonts), which enables character-count
+    wrapping for plain ASCII lines. mono_fits memoises the _mono_fit count per max_width
+    for one width function; callers keep one per font for the render.
+    """
+    if mono_fits is None:
+        mono_fits = {}
+    lines_out: List[str] = []
+    for raw_line in text.split("\n"):
+        if mono_w and _is_plain_ascii(raw_line):
+            n = mono_fits.get(max_width)
+            if n is None:
+                n = mono_fits[max_width] = _mono_fit(width, mono_w, max_width)
+            lines_out.extend(_wrap_monospace(raw_line, n))
+        elif width(raw_line) <= max_width:
+            # Line already fits (blank lines included)
+            lines_out.append(raw_line)
+        else:
+            lines_out.extend(_wrap_measured(raw_line, max_width, width))
+    return lines_out
+
+# Screenplay page geometry in points (72 per inch): US Letter with 1" top/bottom margins
+# and the standard indents, shared by the raster and vector renderers
+PAGE_W, PAGE_H = 612, 792
+MARGIN_T = MARGIN_B = 72
+LEFT_SCENE = LEFT_ACTION = 108
+LEFT_CHAR = 252
+LEFT_DIALOGUE = 180
+LEFT_PAREN = 216
+RIGHT_ACTION = 72
+RIGHT_DIALOGUE = RIGHT_PAREN = 180
+# Text column width for each block type (transitions depend on transition_right_in)
+WIDTH_SCENE = PAGE_W - LEFT_SCENE - RIGHT_ACTION
+WIDTH_ACTION = PAGE_W - LEFT_ACTION - RIGHT_ACTION
+WIDTH_CHAR = PAGE_W - LEFT_CHAR - RIGHT_DIALOGUE
+WIDTH_PAREN = PAGE_W - LEFT_PAREN - RIGHT_PAREN
+WIDTH_DIALOGUE = PAGE_W - LEFT_DIALOGUE - RIGHT_DIALOGUE
+
+def _render_raster_page(page_w: int, page_h: int, font_path: str | None, bold_base_path: str | None, font_size: int, ops: List[tuple]) -> "Image.Image":
+    """Rasterize one laid-out page; ops are (x, y, text, use_bold_font) tuples.
+
+    bold_base_path is the resolved regular font file whose Bold sibling draws bold ops (the
+    discovered font when font_path is None). Module level (and loading fonts itself) so it
+    can run in worker processes.
+    """
+    from PIL import Image, ImageDraw
+    font = load_font(size=font_size, override_path=font_path)
+    fonts = (font, load_bold_variant(font, bold_base_path, font_size))
+    img = Image.new("L", (page_w, page_h), 255)
+    draw = ImageDraw.Draw(img)
+    for x, y, text, use_bold in ops:
+        draw.text((x, y), text, font=fonts[use_bold], fill=0)
+    return img
 
-    # Final sanitation: remove any residual empty or dash-only action blocks
-    sanitized: List[Dict[str, Any]] = []
-    for el in processed:
-        if el.get("type") == "action" and el.get("text", "").strip(" -\t") in {"", "-", "--", "---"}:
-            continue
-        sanitized.append(el)
-    return sanitized
-
-def draw_pdf(elements: List[Dict[str, Any]], out_path: str, title: str = "", font_path: str | None = None, font_size: int = 12, break_style: str = "page", transition_right_in: float = 1.0):
-    # Page setup
-    PAGE_W, PAGE_H = int(8.5*72), int(11*72)  # 612x792
-    MARGIN_T, MARGIN_B = int(1*72), int(1*72)
-    # Indents (in points)
-    LEFT_SCENE = int(1.5*72)
-    LEFT_ACTION = int(1.5*72)
-    LEFT_CHAR = int(3.5*72)
-    LEFT_DIALOGUE = int(2.5*72)
-    LEFT_PAREN = int(3.0*72)
-    RIGHT_DIALOGUE = int(2.5*72)
-    RIGHT_ACTION = int(1.0*72)
-    RIGHT_PAREN = int(2.5*72)
+def draw_pdf(elements: List[Dict[str, Any]], out_path: str | BinaryIO, title: str = "", font_path: str | None = None, font_size: int = 12, break_style: str = "page", transition_right_in: float = 1.0, jobs: int = 1):
+    """Raster (image) PDF rendering using Pillow.
+
+    Pages are laid out first and then rasterized; with jobs > 1 documents of three or more
+    pages are rasterized in that many worker processes.
+    """
+    # Page geometry comes from the module-level constants; only transitions are configurable
     RIGHT_TRANSITION = int(transition_right_in*72)
 
     # Font
     font = load_font(size=font_size, override_path=font_path)
-    # Try to get a bold variant for scene headings
-    bold_font = load_bold_variant(font, font_path, font_size) if font_path else font
-    try:
-        ascent, descent = font.getmetrics()  # type: ignore[attr-defined]
-        line_h = ascent + descent + 2
-    except AttributeError:
-        line_h = int(font_size * 1.2)
-
-    # Create canvas
-    pages: List[Image.Image] = []
-    img = Image.new("RGB", (PAGE_W, PAGE_H), "white")
-    draw = ImageDraw.Draw(img)
+    # Try to get a bold variant for scene headings, next to the discovered font too: a
+    # real bold face draws each heading line once instead of double-striking it
+    # (Pillow's built-in default font has an in-memory path, so only file paths count)
+    base_path = font_path or getattr(font, "path", None)
+    bold_base_path = base_path if isinstance(base_path, str) else None
+    bold_font = load_bold_variant(font, bold_base_path, font_size)
+    metrics = font_metrics(font)
+    line_h = metrics[0] + metrics[1] + 2 if metrics else int(font_size * 1.2)
+
+    # Layout: each page is a list of (x, y, text, use_bold_font) draw ops
+    pages: List[List[tuple]] = []
+    ops: List[tuple] = []
     y = MARGIN_T
 
-    # Robust width measurement (works across Pillow variants)
-    def text_width(s: str) -> float:
-        # Layered fallbacks based on Pillow capabilities
-        try:  # Preferred modern Pillow
-            return draw.textlength(s, font=font)  # type: ignore[attr-defined]
-        except AttributeError:
-            pass
-        try:  # Fallback older API
-            return font.getlength(s)  # type: ignore[attr-defined]
-        except AttributeError:
-            pass
-        try:  # Last resort bbox
+    # Robust width measurement (works across Pillow variants). The font's capabilities
+    # are probed once here rather than with a try/except cascade on every measurement.
+    if hasattr(font, "getlength"):  # Modern Pillow (what ImageDraw.textlength calls)
+        measure_width = font.getlength  # type: ignore[attr-defined]
+    elif hasattr(font, "getbbox"):  # Last resort bbox
+        def measure_width(s: str) -> float:
             left, _top, right, _bottom = font.getbbox(s)  # type: ignore[attr-defined]
             return right - left
-        except AttributeError:
+    else:
+        def measure_width(s: str) -> float:
             return 8.0 * len(s)
 
-    # Wrapper that honors explicit newlines and falls back to monospaced character counts
+    # The font is fixed for the whole render and wrapping re-measures the same words,
+    # names and prefixes constantly, so remember every width we've asked FreeType for
+    width_cache: Dict[str, float] = {}
+    mono_w = 0.0
+
+    def text_width(s: str) -> float:
+        w = width_cache.get(s)
+        if w is None:
+            if mono_w and _is_plain_ascii(s):
+                # Pillow advances are whole 1/64ths, so this product is exactly what
+                # FreeType would return for the run
+                w = width_cache[s] = len(s) * mono_w
+            else:
+                w = width_cache[s] = measure_width(s)
+        return w
+
+    # Monospace fonts (the normal case) have one advance for every ASCII glyph, which
+    # lets wrapping count characters instead of measuring each candidate line, and
+    # text_width multiply instead of calling into Pillow
+    mono_w = _mono_advance(text_width)
+
+    # Character cues, parentheticals and stock lines repeat throughout a script; wrap
+    # each distinct (text, width) once per render. Callers only read the line lists.
+    wrap_cache: Dict[tuple, List[str]] = {}
+    mono_fits: Dict[float, int] = {}
+
     def wrap_text(text: str, max_width: int) -> list:
-        lines_out = []
-        # Split on real newlines, not the string '\\n'
-        for raw_line in text.split("\n"):
-            # If the line already fits, keep it
-            if text_width(raw_line) <= max_width:
-                if raw_line != "":
-                    lines_out.append(raw_line)
-                else:
-                    lines_out.append("")  # preserve blank line
-                continue
-            # Word-wrapping with measurement
-            words = raw_line.split()
-            if not words:
-                lines_out.append("")
-                continue
-            line = ""
-            for w in words:
-                test = w if not line else line + " " + w
-                if text_width(test) <= max_width:
-                    line = test
-                else:
-                    if line:
-                        lines_out.append(line)
-                    # If single word longer than width, hard-wrap by characters
-                    if text_width(w) > max_width:
-                        chunk = ""
-                        for ch in w:
-                            t2 = chunk + ch
-                            if text_width(t2) <= max_width:
-                                chunk = t2
-                            else:
-                                if chunk:
-                                    lines_out.append(chunk)
-                                chunk = ch
-                        if chunk:
-                            line = chunk
-                        else:
-                            line = ""
-                    else:
-                        line = w
-            if line:
-                lines_out.append(line)
-        return lines_out
+        key = (text, max_width)
+        wrapped = wrap_cache.get(key)
+        if wrapped is None:
+            wrapped = wrap_cache[key] = _wrap_text(text, max_width, text_width, mono_w, mono_fits)
+        return wrapped
+
+    # The page header op and the bottom limit never change within a render
+    page_header = [((PAGE_W - text_width(title))//2, int(0.5*72), title, False)] if title else []
+    page_bottom = PAGE_H - MARGIN_B
 
     def new_page():
-        nonlocal img, draw, y
-        pages.append(img)
-        img = Image.new("RGB", (PAGE_W, PAGE_H), "white")
-        draw = ImageDraw.Draw(img)
-        if title:
-            tw = text_width(title)
-            draw.text(((PAGE_W - tw)//2, int(0.5*72)), title, font=font, fill="black")
+        nonlocal ops, y
+        pages.append(ops)
+        ops = page_header.copy()
         y = MARGIN_T
 
     def ensure_space(req_h):
         nonlocal y
-        if y + req_h > PAGE_H - MARGIN_B:
+        if y + req_h > page_bottom:
             new_page()
 
-    def draw_block(text: str, left: int, right_margin: int, extra_before=0, extra_after=0, align_right=False, use_bold=False):
+    def draw_block(text, left: int, right_margin: int, extra_before=0, extra_after=0, align_right=False, use_bold=False):
+        """Draw text (a string, or a list of already split lines) as one block."""
         nonlocal y
         width = PAGE_W - left - right_margin
-        wrapped = wrap_text(text, width) if text else [""]
+        if isinstance(text, list):
+            # Each line wraps (and caches) on its own; no join just to split again
+            wrapped = [part for line in text for part in wrap_text(line, width)] or [""]
+        elif not text:
+            wrapped = [""]
+        elif "\n" not in text and text_width(text) <= width:
+            # Cues, transitions and short shots fit as-is; no wrap pass or cache entry
+            wrapped = [text]
+        else:
+            wrapped = wrap_text(text, width)
         block_h = extra_before + (len(wrapped) * line_h) + extra_after
         ensure_space(block_h)
 
         y += extra_before
+        # Font choice and faux-bold double strike are decided once per block, not per line
+        bold_face = use_bold and bold_font != font
+        double_strike = use_bold and bold_font == font
         for line_text in wrapped:
-            if align_right:
-                tw = text_width(line_text)
-                x = PAGE_W - right_margin - tw
-            else:
-                x = left
-            if use_bold and bold_font != font:
-                draw.text((x, y), line_text, font=bold_font, fill="black")
-            elif use_bold and bold_font == font:
-                draw.text((x, y), line_text, font=font, fill="black")
-                draw.text((x+0.6, y), line_text, font=font, fill="black")
-            else:
-                draw.text((x, y), line_text, font=font, fill="black")
+            # Blank lines only advance y; there is nothing for FreeType to rasterize
+            if line_text:
+                x = PAGE_W - right_margin - text_width(line_text) if align_right else left
+                ops.append((x, y, line_text, bold_face))
+                if double_strike:
+                    ops.append((x+0.6, y, line_text, False))
             y += line_h
         y += extra_after
 
@@ -385,9 +548,17 @@ def draw_pdf(elements: List[Dict[str, Any]], out_path: str, title: str = "", fon
     _ = break_style  # noqa: F841
 
     # Optional header on first page
-    if title:
-        tw = text_width(title)
-        draw.text(((PAGE_W - tw)//2, int(0.5*72)), title, font=font, fill="black")
+    ops.extend(page_header)
+
+    # Single-block element styles, resolved once per render:
+    # type -> (left, right_margin, extra_before, extra_after, align_right, use_bold)
+    block_styles = {
+        "scene": (LEFT_SCENE, RIGHT_ACTION, int(0.25*line_h), int(0.25*line_h), False, True),
+        "shot": (LEFT_ACTION, RIGHT_ACTION, int(0.1*line_h), int(0.1*line_h), False, False),
+        "action": (LEFT_ACTION, RIGHT_ACTION, int(0.2*line_h), int(0.2*line_h), False, False),
+        "transition": (LEFT_ACTION, RIGHT_TRANSITION, int(0.3*line_h), int(0.1*line_h), True, False),
+    }
+    dialogue_gap = int(0.3*line_h)
 
     # Render
     for el in elements:
@@ -395,125 +566,116 @@ def draw_pdf(elements: List[Dict[str, Any]], out_path: str, title: str = "", fon
         if t == "pagebreak":
             # Force a new page for screenplay page break markers (---)
             new_page()
-            continue
-
-        if t == "scene":
-            draw_block(el["text"].upper(), LEFT_SCENE, RIGHT_ACTION, extra_before=int(0.25*line_h), extra_after=int(0.25*line_h), use_bold=True)
-        elif t == "shot":
-            draw_block(el["text"].upper(), LEFT_ACTION, RIGHT_ACTION, extra_before=int(0.1*line_h), extra_after=int(0.1*line_h))
-        elif t == "action":
-            draw_block(el["text"], LEFT_ACTION, RIGHT_ACTION, extra_before=int(0.2*line_h), extra_after=int(0.2*line_h))
         elif t == "dialogue":
             # Character cue (already stripped of @ in parser)
-            draw_block(el["character"].upper(), LEFT_CHAR, RIGHT_DIALOGUE, extra_before=int(0.3*line_h), extra_after=0)
+            draw_block(el["character"], LEFT_CHAR, RIGHT_DIALOGUE, extra_before=dialogue_gap, extra_after=0)
             # Parentheticals
             for p in el.get("parentheticals", []):
                 draw_block(p, LEFT_PAREN, RIGHT_PAREN, extra_before=0, extra_after=0)
             # Dialogue lines: preserve line returns
-            dial = "\n".join(el.get("lines", []))
-            draw_block(dial, LEFT_DIALOGUE, RIGHT_DIALOGUE, extra_before=0, extra_after=int(0.3*line_h))
-        elif t == "transition":
-            draw_block(el["text"], LEFT_ACTION, RIGHT_TRANSITION, extra_before=int(0.3*line_h), extra_after=int(0.1*line_h), align_right=True)
+            draw_block(el.get("lines", []), LEFT_DIALOGUE, RIGHT_DIALOGUE, extra_before=0, extra_after=dialogue_gap)
+        elif t in block_styles:
+            draw_block(el["text"].upper() if t == "scene" else el["text"], *block_styles[t])
+
+    pages.append(ops)
+
+    # Rasterize. Everything is drawn black on white, so 8-bit grayscale pages hold
+    # exactly the same pixels at a third of the memory an RGB page takes.
+    if jobs > 1 and len(pages) > 2:
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import repeat
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pages))) as pool:
+            images = list(pool.map(_render_raster_page, repeat(PAGE_W), repeat(PAGE_H), repeat(font_path), repeat(bold_base_path), repeat(font_size), pages,
+                                   chunksize=max(1, len(pages) // (jobs * 4))))
+    else:
+        images = [_render_raster_page(PAGE_W, PAGE_H, font_path, bold_base_path, font_size, page_ops) for page_ops in pages]
+    # Explicit format so file-like targets (no extension to sniff) work too
+    images[0].save(out_path, format="PDF", save_all=True, append_images=images[1:])
 
-    pages.append(img)
-    pages[0].save(out_path, save_all=True, append_images=pages[1:])
+# ReportLab font name -> TTF path already registered in this process
+_REGISTERED_TTF: Dict[str, str] = {}
+
+def _register_ttf(name: str, path: str) -> bool:
+    """Register a TrueType font with ReportLab once per process; False if it can't be loaded."""
+    if _REGISTERED_TTF.get(name) == path:
+        return True
+    from reportlab.pdfbase import pdfmetrics  # type: ignore
+    from reportlab.pdfbase.ttfonts import TTFont  # type: ignore
+    try:
+        pdfmetrics.registerFont(TTFont(name, path))
+    except OSError:
+        return False
+    _REGISTERED_TTF[name] = path
+    return True
 
-def draw_pdf_vector(elements: List[Dict[str, Any]], out_path: str, title: str = "", font_path: str | None = None, font_size: int = 12, transition_right_in: float = 1.0):
+def _register_ttf_family(font_path: str | None, base_name: str, bold_name: str) -> tuple[str, str]:
+    """Return (regular, bold) ReportLab font names for font_path, registering them if needed.
+
+    Falls back to Courier/Courier-Bold when font_path is missing or unreadable; the bold name
+    only switches over when a Bold sibling file exists next to font_path.
+    """
+    if not font_path or not os.path.exists(font_path) or not _register_ttf(base_name, font_path):
+        return "Courier", "Courier-Bold"
+    root, ext = os.path.splitext(font_path)
+    for cand in [root.replace("Regular","Bold")+ext, root+"-Bold"+ext, root+"Bold"+ext]:
+        if os.path.exists(cand) and _register_ttf(bold_name, cand):
+            return base_name, bold_name
+    return base_name, "Courier-Bold"
+
+def draw_pdf_vector(elements: List[Dict[str, Any]], out_path: str | BinaryIO, title: str = "", font_path: str | None = None, font_size: int = 12, transition_right_in: float = 1.0):
     """Vector (text) PDF rendering using ReportLab for razor sharp output.
 
     Falls back to Courier if no font path provided. Attempts bold variant registration for scene headings.
+    out_path may be a filesystem path or a writable binary file-like object (e.g. io.BytesIO).
+    Raises ImportError, before anything is written, if ReportLab is missing.
     """
     try:
         from reportlab.pdfgen import canvas  # type: ignore
         from reportlab.lib.pagesizes import letter  # type: ignore
         from reportlab.pdfbase import pdfmetrics  # type: ignore
-        from reportlab.pdfbase.ttfonts import TTFont  # type: ignore
     except ImportError as exc:  # pragma: no cover - dependency missing
-        raise SystemExit("ReportLab not installed. Install with: pip install reportlab") from exc
-
-    PAGE_W, PAGE_H = letter  # 612x792 points
-    # Indents
-    LEFT_SCENE = 1.5 * 72
-    LEFT_ACTION = 1.5 * 72
-    LEFT_CHAR = 3.5 * 72
-    LEFT_DIALOGUE = 2.5 * 72
-    LEFT_PAREN = 3.0 * 72
-    RIGHT_DIALOGUE = 2.5 * 72
-    RIGHT_ACTION = 1.0 * 72
+        raise ImportError("ReportLab not installed. Install with: pip install reportlab") from exc
+
+    # Page geometry comes from the module-level constants (letter == PAGE_W x PAGE_H)
     RIGHT_TRANSITION = transition_right_in * 72
-    RIGHT_PAREN = 2.5 * 72
-    TOP_MARGIN = 1.0 * 72
-    BOTTOM_MARGIN = 1.0 * 72
 
     # Font registration
-    base_font_name = "Courier"
-    bold_font_name = "Courier-Bold"
-    if font_path and os.path.exists(font_path):
-        try:
-            pdfmetrics.registerFont(TTFont("ScriptMono", font_path))
-            base_font_name = "ScriptMono"
-            # Try bold variant
-            bold_variant = None
-            root, ext = os.path.splitext(font_path)
-            for cand in [root.replace("Regular","Bold")+ext, root+"-Bold"+ext, root+"Bold"+ext]:
-                if os.path.exists(cand):
-                    try:
-                        pdfmetrics.registerFont(TTFont("ScriptMonoBold", cand))
-                        bold_variant = "ScriptMonoBold"
-                        break
-                    except OSError:
-                        continue
-            if bold_variant:
-                bold_font_name = bold_variant
-        except OSError:
-            pass
+    base_font_name, bold_font_name = _register_ttf_family(font_path, "ScriptMono", "ScriptMonoBold")
 
     line_h = font_size * 1.2  # approximate leading
 
+    width_cache: Dict[tuple, float] = {}
+
     def string_width(txt: str, font_name: str, size: int) -> float:
-        try:
-            return pdfmetrics.stringWidth(txt, font_name, size)
-        except (KeyError, ValueError):
-            return len(txt) * (size * 0.6)
+        key = (font_name, size, txt)
+        w = width_cache.get(key)
+        if w is None:
+            try:
+                w = pdfmetrics.stringWidth(txt, font_name, size)
+            except (KeyError, ValueError):
+                w = len(txt) * (size * 0.6)
+            width_cache[key] = w
+        return w
+
+    mono_widths: Dict[tuple, float] = {}
+    mono_fits: Dict[tuple, Dict[float, int]] = {}
+    # Repeated cues/parentheticals are wrapped once per render (see draw_pdf)
+    wrap_cache: Dict[tuple, List[str]] = {}
 
     def wrap(txt: str, font_name: str, size: int, max_width: float) -> List[str]:
-        lines_out: List[str] = []
-        for raw_line in txt.split("\n"):
-            if string_width(raw_line, font_name, size) <= max_width:
-                lines_out.append(raw_line)
-                continue
-            words = raw_line.split()
-            if not words:
-                lines_out.append("")
-                continue
-            line = ""
-            for w in words:
-                test = w if not line else line+" "+w
-                if string_width(test, font_name, size) <= max_width:
-                    line = test
-                else:
-                    if line:
-                        lines_out.append(line)
-                    # Hard wrap very long token
-                    if string_width(w, font_name, size) > max_width:
-                        chunk = ""
-                        for ch in w:
-                            t2 = chunk + ch
-                            if string_width(t2, font_name, size) <= max_width:
-                                chunk = t2
-                            else:
-                                if chunk:
-                                    lines_out.append(chunk)
-                                chunk = ch
-                        if chunk:
-                            line = chunk
-                        else:
-                            line = ""
-                    else:
-                        line = w
-            if line:
-                lines_out.append(line)
-        return lines_out
+        cache_key = (txt, font_name, size, max_width)
+        wrapped = wrap_cache.get(cache_key)
+        if wrapped is not None:
+            return wrapped
+
+        def width(t: str) -> float:
+            return string_width(t, font_name, size)
+        key = (font_name, size)
+        if key not in mono_widths:
+            mono_widths[key] = _mono_advance(width)
+            mono_fits[key] = {}
+        wrapped = wrap_cache[cache_key] = _wrap_text(txt, max_width, width, mono_widths[key], mono_fits[key])
+        return wrapped
 
     c = canvas.Canvas(out_path, pagesize=letter)
 
@@ -522,31 +684,31 @@ def draw_pdf_vector(elements: List[Dict[str, Any]], out_path: str, title: str =
         if title:
             c.setFont(base_font_name, font_size)
             title_w = string_width(title, base_font_name, font_size)
-            c.drawString((PAGE_W - title_w)/2, PAGE_H - TOP_MARGIN + (font_size*0.2), title)
+            c.drawString((PAGE_W - title_w)/2, PAGE_H - MARGIN_T + (font_size*0.2), title)
 
     # Title first page
     if title:
         c.setFont(base_font_name, font_size)
         title_w = string_width(title, base_font_name, font_size)
-        c.drawString((PAGE_W - title_w)/2, PAGE_H - TOP_MARGIN + (font_size*0.2), title)
+        c.drawString((PAGE_W - title_w)/2, PAGE_H - MARGIN_T + (font_size*0.2), title)
 
-    y = PAGE_H - TOP_MARGIN - line_h
+    y = PAGE_H - MARGIN_T - line_h
 
     def ensure_space(lines_needed: int):
         nonlocal y
-        if y - (lines_needed * line_h) < BOTTOM_MARGIN:
+        if y - (lines_needed * line_h) < MARGIN_B:
             new_page()
-            y = PAGE_H - TOP_MARGIN - line_h
+            y = PAGE_H - MARGIN_T - line_h
 
     for el in elements:
         t = el["type"]
         if t == "pagebreak":
             new_page()
-            y = PAGE_H - TOP_MARGIN - line_h
+            y = PAGE_H - MARGIN_T - line_h
             continue
         if t == "scene":
             txt = el["text"].upper()
-            wrapped = wrap(txt, bold_font_name, font_size, PAGE_W - LEFT_SCENE - RIGHT_ACTION)
+            wrapped = wrap(txt, bold_font_name, font_size, WIDTH_SCENE)
             ensure_space(len(wrapped)+1)
             c.setFont(bold_font_name, font_size)
             for line in wrapped:
@@ -554,8 +716,8 @@ def draw_pdf_vector(elements: List[Dict[str, Any]], out_path: str, title: str =
                 y -= line_h
             y -= line_h * 0.25
         elif t == "shot":
-            txt = el["text"].upper()
-            wrapped = wrap(txt, base_font_name, font_size, PAGE_W - LEFT_ACTION - RIGHT_ACTION)
+            txt = el["text"]
+            wrapped = wrap(txt, base_font_name, font_size, WIDTH_ACTION)
             ensure_space(len(wrapped)+1)
             c.setFont(base_font_name, font_size)
             for line in wrapped:
@@ -564,7 +726,7 @@ def draw_pdf_vector(elements: List[Dict[str, Any]], out_path: str, title: str =
             y -= line_h * 0.1
         elif t == "action":
             txt = el["text"]
-            wrapped = wrap(txt, base_font_name, font_size, PAGE_W - LEFT_ACTION - RIGHT_ACTION)
+            wrapped = wrap(txt, base_font_name, font_size, WIDTH_ACTION)
             ensure_space(len(wrapped)+1)
             c.setFont(base_font_name, font_size)
             for line in wrapped:
@@ -574,21 +736,23 @@ def draw_pdf_vector(elements: List[Dict[str, Any]], out_path: str, title: str =
         elif t == "dialogue":
             # Character
             c.setFont(base_font_name, font_size)
-            char_lines = wrap(el["character"].upper(), base_font_name, font_size, PAGE_W - LEFT_CHAR - RIGHT_DIALOGUE)
+            char_lines = wrap(el["character"], base_font_name, font_size, WIDTH_CHAR)
             ensure_space(len(char_lines)+len(el.get("parentheticals", []))+len(el.get("lines", []))+2)
             for line in char_lines:
                 c.drawString(LEFT_CHAR, y, line)
                 y -= line_h
             # Parentheticals
             for p in el.get("parentheticals", []):
-                for line in wrap(p, base_font_name, font_size, PAGE_W - LEFT_PAREN - RIGHT_PAREN):
+                for line in wrap(p, base_font_name, font_size, WIDTH_PAREN):
                     c.drawString(LEFT_PAREN, y, line)
                     y -= line_h
-            # Dialogue body
-            dial_text = "\n".join(el.get("lines", []))
-            for line in wrap(dial_text, base_font_name, font_size, PAGE_W - LEFT_DIALOGUE - RIGHT_DIALOGUE):
-                c.drawString(LEFT_DIALOGUE, y, line)
-                y -= line_h
+            # Dialogue body: the parser already split it into lines, so wrap each one
+            # rather than joining them for wrap() to split again
+            dial_lines = el.get("lines", [])
+            for raw_line in dial_lines or [""]:
+                for line in wrap(raw_line, base_font_name, font_size, WIDTH_DIALOGUE):
+                    c.drawString(LEFT_DIALOGUE, y, line)
+                    y -= line_h
             y -= line_h * 0.3
         elif t == "transition":
             txt = el["text"]
@@ -602,14 +766,31 @@ def draw_pdf_vector(elements: List[Dict[str, Any]], out_path: str, title: str =
 
     c.save()
 
-def convert_markdown_to_pdf(md_path: str, pdf_path: str, title: str = "", font_path: str | None = None, font_size: int = 12, break_style: str = "page", transition_right_in: float = 1.0):
+def convert_markdown_to_pdf(md_path: str, pdf_path: str, title: str = "", font_path: str | None = None, font_size: int = 12, break_style: str = "page", transition_right_in: float = 1.0, raster: bool = False, jobs: int = 1):
+    """Parse a Markdown screenplay file and write it as a PDF, returning the parsed elements.
+
+    Renders vector text with ReportLab by default, falling back to raster when it is missing;
+    raster=True selects the legacy Pillow image pipeline, rasterizing pages in `jobs` processes.
+    """
     with open(md_path, "r", encoding="utf-8") as f:
         md = f.read()
     elements = parse_screenplay_markdown(md)
-    draw_pdf(elements, pdf_path, title=title, font_path=font_path, font_size=font_size, break_style=break_style, transition_right_in=transition_right_in)
+    if not raster:
+        try:
+            draw_pdf_vector(elements, pdf_path, title=title, font_path=font_path, font_size=font_size, transition_right_in=transition_right_in)
+            return elements
+        except ImportError:  # ReportLab missing
+            pass
+    draw_pdf(elements, pdf_path, title=title, font_path=font_path, font_size=font_size, break_style=break_style, transition_right_in=transition_right_in, jobs=jobs)
     return elements
 
-def write_shot_list(elements: List[Dict[str, Any]], out_path: str, include_entities: bool = False):
+def _open_text_output(out: str | TextIO, newline: str | None = None):
+    """Open a path for writing, or pass an already-open text stream through untouched."""
+    if isinstance(out, str):
+        return open(out, "w", newline=newline, encoding="utf-8")
+    return contextlib.nullcontext(out)
+
+def write_shot_list(elements: List[Dict[str, Any]], out_path: str | TextIO, include_entities: bool = False, fmt: str | None = None):
     """Generate a shot list file (CSV or Markdown) from parsed elements.
 
     Strategy:
@@ -617,45 +798,51 @@ def write_shot_list(elements: List[Dict[str, Any]], out_path: str, include_entit
     - Each explicit shot heading (! ...) becomes a row (type=SHOT)
     - Include short action summary snippet (first following action block)
     - Optionally append entity inventories (characters, locations, objects) when include_entities=True
+
+    out_path may be a path (format chosen by its extension) or a text stream; fmt ("csv" or
+    "markdown") overrides the extension and is how the format is chosen for streams.
+    Returns the (rows, entities) pair from build_shot_list so callers need not rebuild it.
     """
     rows, entities = build_shot_list(elements, include_entities=include_entities)
 
-    is_csv = out_path.lower().endswith(".csv")
+    if fmt is not None:
+        is_csv = fmt == "csv"
+    else:
+        is_csv = isinstance(out_path, str) and out_path.lower().endswith(".csv")
     if is_csv:
         import csv
-        with open(out_path, "w", newline="", encoding="utf-8") as f:
+        with _open_text_output(out_path, newline="") as f:
             writer = csv.writer(f)
             writer.writerow(["#", "Type", "Scene", "Shot", "Summary"])
-            for r in rows:
-                writer.writerow([r["no"], r["type"], r["scene"], r["shot"], r["summary"]])
+            writer.writerows([r["no"], r["type"], r["scene"], r["shot"], r["summary"]] for r in rows)
             if include_entities:
                 # Insert blank separator row
                 writer.writerow([])
                 writer.writerow(["Inventory", "Category", "Name", "Count", "First Mention"])
                 for cat in ("characters", "locations", "objects"):
-                    for name, meta in entities.get(cat, {}).items():
-                        writer.writerow(["", cat[:-1].title(), name, meta["count"], meta["first_index"]])
+                    writer.writerows(["", cat[:-1].title(), name, meta["count"], meta["first_index"]] for name, meta in entities.get(cat, {}).items())
     else:
-        with open(out_path, "w", encoding="utf-8") as f:
-            f.write("| # | Type | Scene | Shot | Summary |\n")
-            f.write("|---|------|-------|------|---------|\n")
-            for r in rows:
-                f.write(f"| {r['no']} | {r['type']} | {r['scene']} | {r['shot']} | {r['summary']} |\n")
-            if include_entities and entities:
-                f.write("\n## Entity Inventory\n\n")
-                def write_subtable(cat: str, title: str):
-                    items = entities.get(cat, {})
-                    if not items:
-                        return
-                    f.write(f"### {title}\n\n")
-                    f.write("| Name | Count | First Mention (element index) |\n")
-                    f.write("|------|-------|------------------------------|\n")
-                    for name, meta in sorted(items.items(), key=lambda kv: (-kv[1]['count'], kv[1]['first_index'])):
-                        f.write(f"| {name} | {meta['count']} | {meta['first_index']} |\n")
-                    f.write("\n")
-                write_subtable("characters", "Characters")
-                write_subtable("locations", "Locations")
-                write_subtable("objects", "Objects / Props")
+        # Assemble the whole table in memory and write it in one call
+        parts = ["| # | Type | Scene | Shot | Summary |\n", "|---|------|-------|------|---------|\n"]
+        parts.extend(f"| {r['no']} | {r['type']} | {r['scene']} | {r['shot']} | {r['summary']} |\n" for r in rows)
+        if include_entities and entities:
+            parts.append("\n## Entity Inventory\n\n")
+            def add_subtable(cat: str, title: str):
+                items = entities.get(cat, {})
+                if not items:
+                    return
+                parts.append(f"### {title}\n\n")
+                parts.append("| Name | Count | First Mention (element index) |\n")
+                parts.append("|------|-------|------------------------------|\n")
+                parts.extend(f"| {name} | {meta['count']} | {meta['first_index']} |\n"
+                             for name, meta in _ranked_entities(items))
+                parts.append("\n")
+            add_subtable("characters", "Characters")
+            add_subtable("locations", "Locations")
+            add_subtable("objects", "Objects / Props")
+        with _open_text_output(out_path) as f:
+            f.write("".join(parts))
+    return rows, entities
 
 def build_shot_list(elements: List[Dict[str, Any]], include_entities: bool = False):
     """Build rows and optional entities for a shot list without writing files."""
@@ -668,17 +855,18 @@ def build_shot_list(elements: List[Dict[str, Any]], include_entities: bool = Fal
             summary = _next_action_snippet(elements, idx)
             rows.append({"no": len(rows)+1, "type": "SCENE", "scene": current_scene, "shot": "", "summary": summary})
         elif t == "shot":
-            shot_text = el.get("text", "").upper()
+            shot_text = el.get("text", "")
             summary = _next_action_snippet(elements, idx)
             rows.append({"no": len(rows)+1, "type": "SHOT", "scene": current_scene, "shot": shot_text, "summary": summary})
     entities = extract_entities(elements) if include_entities else {}
     return rows, entities
 
-def render_shot_list_pdf(rows: List[Dict[str, Any]], entities: Dict[str, Any], out_path: str, font_path: str | None = None, font_size: int = 12, title: str = "Shot List", include_entities: bool = False, landscape: bool = False):
+def render_shot_list_pdf(rows: List[Dict[str, Any]], entities: Dict[str, Any], out_path: str | BinaryIO, font_path: str | None = None, font_size: int = 12, title: str = "Shot List", include_entities: bool = False, landscape: bool = False):
     """Render the shot list (and optionally entity inventories) into a PDF using Pillow.
 
     landscape: if True, page size is 11" x 8.5" to provide wider columns.
     """
+    from PIL import Image, ImageDraw
     if landscape:
         PAGE_W, PAGE_H = int(11*72), int(8.5*72)
     else:
@@ -687,37 +875,54 @@ def render_shot_list_pdf(rows: List[Dict[str, Any]], entities: Dict[str, Any], o
     MARGIN_T, MARGIN_B = int(0.75*72), int(0.75*72)
     font = load_font(size=font_size, override_path=font_path)
     bold_font = load_bold_variant(font, font_path, font_size) if font_path else font
-    try:
-        ascent, descent = font.getmetrics()  # type: ignore[attr-defined]
-        line_h = ascent + descent + 4
-    except AttributeError:
-        line_h = int(font_size * 1.3)
+    metrics = font_metrics(font)
+    line_h = metrics[0] + metrics[1] + 4 if metrics else int(font_size * 1.3)
+
+    measure_cache: Dict[tuple, int] = {}
+    # Per-font shared ASCII advance (0 when proportional): a monospace width table
+    # collapses to one number, so plain ASCII text is measured without calling PIL
+    mono_advances: Dict[int, float] = {}
 
     def measure(text: str, fnt) -> int:
-        img_tmp = Image.new("RGB", (10,10))
-        dr = ImageDraw.Draw(img_tmp)
+        key = (id(fnt), text)
+        w = measure_cache.get(key)
+        if w is not None:
+            return w
+        adv = mono_advances.get(id(fnt))
+        if adv is None:
+            try:
+                adv = _mono_advance(fnt.getlength)  # type: ignore[attr-defined]
+            except AttributeError:
+                adv = 0.0
+            mono_advances[id(fnt)] = adv
+        if adv and _is_plain_ascii(text):
+            w = measure_cache[key] = int(len(text) * adv)
+            return w
         try:
-            return int(dr.textlength(text, font=fnt))  # type: ignore[attr-defined]
+            # Ask the font directly; no scratch image or ImageDraw needed
+            w = int(fnt.getlength(text))  # type: ignore[attr-defined]
         except AttributeError:
             try:
                 left, _top, right, _bottom = fnt.getbbox(text)  # type: ignore[attr-defined]
-                return right-left
+                w = right-left
             except (AttributeError, OSError):
-                return len(text)*8
+                w = len(text)*8
+        measure_cache[key] = w
+        return w
 
     # Determine column widths (max content up to a cap)
     col_keys = ["no", "type", "scene", "shot", "summary"]
     headers = {"no": "#", "type": "Type", "scene": "Scene", "shot": "Shot", "summary": "Summary"}
     max_widths = {k: measure(headers[k], bold_font) for k in col_keys}
-    for r in rows:
-        scene_txt = str(r["scene"]).replace("\n", " ")
-        shot_txt = str(r["shot"]).replace("\n", " ")
-        summary_txt = str(r["summary"]).replace("\n", " ")
-        max_widths["no"] = max(max_widths["no"], measure(str(r["no"]), font))
-        max_widths["type"] = max(max_widths["type"], measure(r["type"], font))
-        max_widths["scene"] = max(max_widths["scene"], measure(scene_txt, font))
-        max_widths["shot"] = max(max_widths["shot"], measure(shot_txt, font))
-        max_widths["summary"] = max(max_widths["summary"], measure(summary_txt, font))
+    # Stringify every cell once; width discovery and wrapping both read these
+    cells = [{k: str(r[k]) for k in col_keys} for r in rows]
+    # Widest entry per column, reduced a column at a time; text columns are measured
+    # with their line breaks flattened to spaces
+    for k in col_keys:
+        texts = [r[k] for r in cells]
+        if k in ("scene", "shot", "summary"):
+            texts = [t.replace("\n", " ") for t in texts]
+        max_widths[k] = max([max_widths[k]] + [measure(t, font) for t in texts])
 
     # Cap some columns to leave room for summary
     # Allow wider caps in landscape mode
@@ -738,31 +943,47 @@ def render_shot_list_pdf(rows: List[Dict[str, Any]], entities: Dict[str, Any], o
         table_width = sum(max_widths[k] for k in col_keys) + gap*(len(col_keys)-1)
 
     pages: List[Image.Image] = []
-    img = Image.new("RGB", (PAGE_W, PAGE_H), "white")
+    # Grayscale pages: black-on-white text needs no colour channels
+    img = Image.new("L", (PAGE_W, PAGE_H), 255)
     dr = ImageDraw.Draw(img)
     y = MARGIN_T
 
     def new_page():
         nonlocal img, dr, y
         pages.append(img)
-        img = Image.new("RGB", (PAGE_W, PAGE_H), "white")
+        img = Image.new("L", (PAGE_W, PAGE_H), 255)
         dr = ImageDraw.Draw(img)
         y = MARGIN_T
         if title:
             tw = measure(title, bold_font)
-            dr.text(((PAGE_W - tw)//2, int(0.4*72)), title, font=bold_font, fill="black")
+            dr.text(((PAGE_W - tw)//2, int(0.4*72)), title, font=bold_font, fill=0)
             y = int(0.4*72) + line_h + 10
 
     # Title on first page
     if title:
         tw = measure(title, bold_font)
-        dr.text(((PAGE_W - tw)//2, int(0.4*72)), title, font=bold_font, fill="black")
+        dr.text(((PAGE_W - tw)//2, int(0.4*72)), title, font=bold_font, fill=0)
         y = int(0.4*72) + line_h + 10
 
+    # Cells are word-wrapped on collapsed whitespace. With a monospace font a plain ASCII
+    # cell wraps by character count (one fit per column width) instead of remeasuring
+    # the growing line for every word.
+    cell_mono = _mono_advance(lambda t: measure(t, font))
+    fit_chars: Dict[int, int] = {}
+
     def wrap_cell(text: str, width: int) -> List[str]:
         if not text:
             return [""]
+        # Most cells ("#", type, short scenes) already fit as written
+        if measure(text, font) <= width and _is_single_spaced(text):
+            return [text]
         words = text.split()
+        if cell_mono:
+            flat = " ".join(words)
+            if _is_plain_ascii(flat):
+                if width not in fit_chars:
+                    fit_chars[width] = _mono_fit(lambda t: measure(t, font), cell_mono, width)
+                return _wrap_measured(flat, fit_chars[width], len)
         lines = []
         cur = ""
         for w in words:
@@ -803,25 +1024,28 @@ def render_shot_list_pdf(rows: List[Dict[str, Any]], entities: Dict[str, Any], o
     ensure_space(header_h)
     x = MARGIN_L
     for k in col_keys:
-        dr.text((x, y), headers[k], font=bold_font, fill="black")
+        dr.text((x, y), headers[k], font=bold_font, fill=0)
         x += max_widths[k] + gap
     y += line_h + 4
 
     # Draw rows
-    for r in rows:
+    for r in cells:
         # Wrap cells
-        wrapped_cells = {k: wrap_cell(str(r[k]), max_widths[k]) for k in col_keys}
+        wrapped_cells = {k: wrap_cell(r[k], max_widths[k]) for k in col_keys}
         row_lines = max(len(v) for v in wrapped_cells.values())
         req_h = row_lines * line_h + 4
         ensure_space(req_h)
-        for i_line in range(row_lines):
-            x = MARGIN_L
-            for k in col_keys:
-                txt_line = wrapped_cells[k][i_line] if i_line < len(wrapped_cells[k]) else ""
-                dr.text((x, y), txt_line, font=font, fill="black")
-                x += max_widths[k] + gap
-            y += line_h
-        y += 4
+        # Draw column by column; short cells stop early and empty lines are skipped,
+        # so text() is only called for lines that put ink on the page
+        x = MARGIN_L
+        for k in col_keys:
+            line_y = y
+            for txt_line in wrapped_cells[k]:
+                if txt_line:
+                    dr.text((x, line_y), txt_line, font=font, fill=0)
+                line_y += line_h
+            x += max_widths[k] + gap
+        y += row_lines * line_h + 4
 
     # Entities inventory (optionally) each category with subheading
     if include_entities and entities:
@@ -829,40 +1053,39 @@ def render_shot_list_pdf(rows: List[Dict[str, Any]], entities: Dict[str, Any], o
         y += 15
         # Start new page if insufficient space
         ensure_space(line_h * 5)
-        dr.text((MARGIN_L, y), "Entity Inventory", font=bold_font, fill="black")
+        dr.text((MARGIN_L, y), "Entity Inventory", font=bold_font, fill=0)
         y += line_h + 8
         for cat, title_cat in (("characters", "Characters"), ("locations", "Locations"), ("objects", "Objects / Props")):
             items = entities.get(cat, {})
             if not items:
                 continue
             ensure_space(line_h * 4)
-            dr.text((MARGIN_L, y), title_cat, font=bold_font, fill="black")
+            dr.text((MARGIN_L, y), title_cat, font=bold_font, fill=0)
             y += line_h + 4
             # Column headers (bold, no underline)
             hdrs = ["Name", "Count", "First"]
             colw = [int(PAGE_W*0.45), int(PAGE_W*0.12), int(PAGE_W*0.15)]
             x_positions = [MARGIN_L, MARGIN_L + colw[0] + 12, MARGIN_L + colw[0] + 12 + colw[1] + 12]
             for i, htxt in enumerate(hdrs):
-                dr.text((x_positions[i], y), htxt, font=bold_font, fill="black")
+                dr.text((x_positions[i], y), htxt, font=bold_font, fill=0)
             y += line_h + 4
-            for name, meta in sorted(items.items(), key=lambda kv: (-kv[1]['count'], kv[1]['first_index'])):
+            for name, meta in _ranked_entities(items):
                 ensure_space(line_h)
-                dr.text((x_positions[0], y), name, font=font, fill="black")
-                dr.text((x_positions[1], y), str(meta['count']), font=font, fill="black")
-                dr.text((x_positions[2], y), str(meta['first_index']), font=font, fill="black")
+                dr.text((x_positions[0], y), name, font=font, fill=0)
+                dr.text((x_positions[1], y), str(meta['count']), font=font, fill=0)
+                dr.text((x_positions[2], y), str(meta['first_index']), font=font, fill=0)
                 y += line_h
             # Add spacing between entity categories
             y += 12
 
     pages.append(img)
-    pages[0].save(out_path, save_all=True, append_images=pages[1:])
+    pages[0].save(out_path, format="PDF", save_all=True, append_images=pages[1:])
 
-def render_shot_list_pdf_vector(rows: List[Dict[str, Any]], entities: Dict[str, Any], out_path: str, font_path: str | None = None, font_size: int = 12, title: str = "Shot List", include_entities: bool = False, landscape: bool = False):
+def render_shot_list_pdf_vector(rows: List[Dict[str, Any]], entities: Dict[str, Any], out_path: str | BinaryIO, font_path: str | None = None, font_size: int = 12, title: str = "Shot List", include_entities: bool = False, landscape: bool = False):
     """Vector (ReportLab) version of shot list PDF. Falls back by raising ImportError if reportlab missing."""
     from reportlab.pdfgen import canvas  # type: ignore
     from reportlab.lib.pagesizes import letter, landscape as rl_landscape  # type: ignore
     from reportlab.pdfbase import pdfmetrics  # type: ignore
-    from reportlab.pdfbase.ttfonts import TTFont  # type: ignore
 
     PAGE_W, PAGE_H = (letter if not landscape else rl_landscape(letter))
     margin_l = 36
@@ -870,46 +1093,54 @@ def render_shot_list_pdf_vector(rows: List[Dict[str, Any]], entities: Dict[str,
     margin_t = 54
     margin_b = 54
 
-    base_font = "Courier"
-    bold_font = "Courier-Bold"
-    if font_path and os.path.exists(font_path):
-        try:
-            pdfmetrics.registerFont(TTFont("SLMono", font_path))
-            base_font = "SLMono"
-            # Bold attempt
-            root, ext = os.path.splitext(font_path)
-            for cand in [root.replace("Regular","Bold")+ext, root+"-Bold"+ext, root+"Bold"+ext]:
-                if os.path.exists(cand):
-                    try:
-                        pdfmetrics.registerFont(TTFont("SLMonoBold", cand))
-                        bold_font = "SLMonoBold"
-                        break
-                    except OSError:
-                        continue
-        except OSError:
-            pass
+    base_font, bold_font = _register_ttf_family(font_path, "SLMono", "SLMonoBold")
 
     line_h = font_size * 1.25
+    # Spacings reused by the row and entity loops, computed once
+    row_pad = line_h * 0.2
+    heading_step = line_h * 1.2
 
-    def sw(txt: str, font_name: str = base_font, size: int = font_size) -> float:
+    width_cache: Dict[tuple, float] = {}
+    # In a monospace font every plain ASCII string of one length has the same width, so
+    # after the first of each length the width is a lookup, not a stringWidth call
+    mono_fonts: Dict[tuple, bool] = {}
+    length_widths: Dict[tuple, float] = {}
+
+    def string_width(txt: str, font_name: str, size: int) -> float:
         try:
             return pdfmetrics.stringWidth(txt, font_name, size)
         except (KeyError, ValueError):
             return len(txt) * (size * 0.6)
 
+    def sw(txt: str, font_name: str = base_font, size: int = font_size) -> float:
+        key = (font_name, size, txt)
+        w = width_cache.get(key)
+        if w is None:
+            font_key = (font_name, size)
+            mono = mono_fonts.get(font_key)
+            if mono is None:
+                mono = mono_fonts[font_key] = bool(_mono_advance(lambda t: string_width(t, font_name, size)))
+            if mono and _is_plain_ascii(txt):
+                len_key = (font_name, size, len(txt))
+                w = length_widths.get(len_key)
+                if w is None:
+                    w = length_widths[len_key] = string_width(txt, font_name, size)
+            else:
+                w = string_width(txt, font_name, size)
+            width_cache[key] = w
+        return w
+
     # Column setup (reuse logic from raster but recompute widths with stringWidth)
     col_keys = ["no", "type", "scene", "shot", "summary"]
     headers = {"no": "#", "type": "Type", "scene": "Scene", "shot": "Shot", "summary": "Summary"}
     max_widths = {k: sw(headers[k], bold_font) for k in col_keys}
-    for r in rows:
-        scene_txt = str(r["scene"]).replace("\n", " ")
-        shot_txt = str(r["shot"]).replace("\n", " ")
-        summary_txt = str(r["summary"]).replace("\n", " ")
-        max_widths["no"] = max(max_widths["no"], sw(str(r["no"])) )
-        max_widths["type"] = max(max_widths["type"], sw(r["type"]))
-        max_widths["scene"] = max(max_widths["scene"], sw(scene_txt))
-        max_widths["shot"] = max(max_widths["shot"], sw(shot_txt))
-        max_widths["summary"] = max(max_widths["summary"], sw(summary_txt))
+    # Stringify every cell once, as in the raster renderer
+    cells = [{k: str(r[k]) for k in col_keys} for r in rows]
+    for k in col_keys:
+        texts = [r[k] for r in cells]
+        if k in ("scene", "shot", "summary"):
+            texts = [t.replace("\n", " ") for t in texts]
+        max_widths[k] = max([max_widths[k]] + [sw(t) for t in texts])
 
     cap_scene = PAGE_W * (0.18 if not landscape else 0.25)
     cap_shot = PAGE_W * (0.14 if not landscape else 0.20)
@@ -926,10 +1157,22 @@ def render_shot_list_pdf_vector(rows: List[Dict[str, Any]], entities: Dict[str,
         for k in max_widths:
             max_widths[k] *= scale
 
+    # Monospace cells wrap by character count, as in the raster renderer
+    cell_mono = _mono_advance(sw)
+    fit_chars: Dict[float, int] = {}
+
     def wrap_cell(text: str, width: float) -> List[str]:
         if not text:
             return [""]
+        if sw(text) <= width and _is_single_spaced(text):
+            return [text]
         words = text.split()
+        if cell_mono:
+            flat = " ".join(words)
+            if _is_plain_ascii(flat):
+                if width not in fit_chars:
+                    fit_chars[width] = _mono_fit(sw, cell_mono, width)
+                return _wrap_measured(flat, fit_chars[width], len)
         lines: List[str] = []
         cur = ""
         for w in words:
@@ -993,23 +1236,27 @@ def render_shot_list_pdf_vector(rows: List[Dict[str, Any]], entities: Dict[str,
     for k in col_keys:
         c.drawString(x, header_baseline, headers[k])
         x += max_widths[k] + gap
-    y = header_baseline - line_h * 1.2  # spacing after header (no underline)
+    y = header_baseline - heading_step  # spacing after header (no underline)
 
     # Rows
     c.setFont(base_font, font_size)
-    for r in rows:
-        cells_wrapped = {k: wrap_cell(str(r[k]), max_widths[k]) for k in col_keys}
+    for r in cells:
+        cells_wrapped = {k: wrap_cell(r[k], max_widths[k]) for k in col_keys}
         row_lines = max(len(v) for v in cells_wrapped.values())
-        req_h = row_lines * line_h + line_h*0.2
+        req_h = row_lines * line_h + row_pad
         ensure_space(req_h)
-        for i_line in range(row_lines):
-            x = margin_l
-            for k in col_keys:
-                txt_line = cells_wrapped[k][i_line] if i_line < len(cells_wrapped[k]) else ""
-                c.drawString(x, y, txt_line)
-                x += max_widths[k] + gap
-            y -= line_h
-        y -= line_h*0.2
+        # One text object per non-empty cell, its lines spaced by the leading, instead
+        # of a drawString (and PDF text object) per cell line
+        x = margin_l
+        for k in col_keys:
+            cell_lines = cells_wrapped[k]
+            if cell_lines != [""]:
+                text_obj = c.beginText(x, y)
+                text_obj.setLeading(line_h)
+                text_obj.textLines(cell_lines, trim=0)
+                c.drawText(text_obj)
+            x += max_widths[k] + gap
+        y -= row_lines * line_h + row_pad
 
     # Entities
     if include_entities and entities:
@@ -1026,23 +1273,37 @@ def render_shot_list_pdf_vector(rows: List[Dict[str, Any]], entities: Dict[str,
             ensure_space(line_h*4)
             c.setFont(bold_font, font_size)
             c.drawString(margin_l, y, title_cat)
-            y -= line_h * 1.2
+            y -= heading_step
             c.setFont(bold_font, font_size-1)
             c.drawString(margin_l, y, "Name")
             c.drawString(margin_l+260, y, "Count")
             c.drawString(margin_l+320, y, "First")
-            y -= line_h * 1.2
+            y -= heading_step
             c.setFont(base_font, font_size-1)
-            for name, meta in sorted(items.items(), key=lambda kv: (-kv[1]['count'], kv[1]['first_index'])):
+            for name, meta in _ranked_entities(items):
                 ensure_space(line_h)
                 c.drawString(margin_l, y, name)
                 c.drawString(margin_l+260, y, str(meta['count']))
                 c.drawString(margin_l+320, y, str(meta['first_index']))
                 y -= line_h
-            y -= line_h * 1.2
+            y -= heading_step
 
     c.save()
 
+# Scene heading prefixes, time-of-day words and object tokens used by extract_entities
+_SCENE_PREFIX_RE = re.compile(r"^(INT\.?/EXT\.?|INT\.?|EXT\.?)\s+")
+_OBJ_TOKEN_RE = re.compile(r"[A-Z][A-Z0-9'&]{2,}")
+_TIME_WORDS = frozenset({"DAY", "NIGHT", "MORNING", "EVENING", "LATER", "CONTINUOUS", "SAME TIME", "MOMENTS LATER", "DAWN", "DUSK"})
+_IGNORE_OBJ = _TIME_WORDS | {"INT", "EXT", "INT/EXT", "AND", "THE", "A", "AN", "CUT", "TO", "FADE", "ON", "IN", "OUT", "ANGLE", "CLOSE", "UP", "POV", "WIDE", "TRACKING", "SHOT"}
+
+def _entity_rank(item) -> tuple:
+    """Sort key for (name, meta) entity pairs: most mentioned first, then first mention."""
+    return (-item[1]["count"], item[1]["first_index"])
+
+def _ranked_entities(items: Dict[str, Dict[str, int]]) -> list:
+    """(name, meta) pairs of one entity category in inventory order."""
+    return sorted(items.items(), key=_entity_rank)
+
 def extract_entities(elements: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, int]]]:
     """Heuristically extract characters, locations, and objects/props from parsed elements.
 
@@ -1055,21 +1316,18 @@ def extract_entities(elements: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict
     loc_map: Dict[str, Dict[str, int]] = {}
     obj_map: Dict[str, Dict[str, int]] = {}
 
-    time_words = {"DAY", "NIGHT", "MORNING", "EVENING", "LATER", "CONTINUOUS", "SAME TIME", "MOMENTS LATER", "DAWN", "DUSK"}
-    ignore_obj = time_words | {"INT", "EXT", "INT/EXT", "AND", "THE", "A", "AN", "CUT", "TO", "FADE", "ON", "IN", "OUT", "ANGLE", "CLOSE", "UP", "POV", "WIDE", "TRACKING", "SHOT"}
-
     # Extract characters & locations first
     for idx, el in enumerate(elements):
         t = el.get("type")
         if t == "dialogue":
-            name = el.get("character", "").upper()
+            name = el.get("character", "")
             if name:
                 entry = char_map.setdefault(name, {"count": 0, "first_index": idx})
                 entry["count"] += 1
         elif t == "scene":
             raw = el.get("text", "").upper()
             # Strip leading INT./EXT. prefixes
-            loc = re.sub(r"^(INT\.?/EXT\.?|INT\.?|EXT\.?)\s+", "", raw).strip()
+            loc = _SCENE_PREFIX_RE.sub("", raw).strip()
             # Split off time segment using ' - '
             parts = [p.strip() for p in loc.split("-")]
             if parts:
@@ -1077,7 +1335,7 @@ def extract_entities(elements: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict
                 # Reconstruct location excluding trailing time descriptors
                 filtered = []
                 for p in parts:
-                    if p.replace(" ", "") in time_words:
+                    if p.replace(" ", "") in _TIME_WORDS:
                         break
                     filtered.append(p)
                 loc_clean = " - ".join(filtered) if filtered else parts[0]
@@ -1087,18 +1345,17 @@ def extract_entities(elements: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict
                     entry["count"] += 1
 
     # Gather objects from action and shot text
-    known_names = set(char_map.keys()) | set(loc_map.keys()) | ignore_obj
-    token_re = re.compile(r"[A-Z][A-Z0-9'&]{2,}")
+    known_names = set(char_map.keys()) | set(loc_map.keys()) | _IGNORE_OBJ
+    # Tokens always start with a letter, so no pure-number check is needed
+    find_tokens = _OBJ_TOKEN_RE.findall
     for idx, el in enumerate(elements):
         if el.get("type") in {"action", "shot"}:
-            txt = el.get("text", "").upper()
-            for token in token_re.findall(txt):
+            for token in find_tokens(el.get("text", "").upper()):
                 if token in known_names:
                     continue
-                # Ignore if token is part of a longer location name (substring) or pure number
-                if token.isdigit():
-                    continue
-                entry = obj_map.setdefault(token, {"count": 0, "first_index": idx})
+                entry = obj_map.get(token)
+                if entry is None:
+                    entry = obj_map[token] = {"count": 0, "first_index": idx}
                 entry["count"] += 1
 
     return {"characters": char_map, "locations": loc_map, "objects": obj_map}
@@ -1115,7 +1372,7 @@ def _next_action_snippet(elements: List[Dict[str, Any]], start_index: int, max_l
             break
     return ""
 
-def write_fcpxml(elements: List[Dict[str, Any]], out_path: str, title: str, wpm: int = 160, fps: int = 25, include_titles: bool = False, title_seconds: float = 2.0, title_uid: str | None = None):
+def write_fcpxml(elements: List[Dict[str, Any]], out_path: str | TextIO, title: str, wpm: int = 160, fps: int = 25, include_titles: bool = False, title_seconds: float = 2.0, title_uid: str | None = None):
     """Export a minimal FCPXML (Final Cut Pro) document with:
 
     - Each scene heading as a chapter marker (blue) at its estimated start time.
@@ -1127,20 +1384,25 @@ def write_fcpxml(elements: List[Dict[str, Any]], out_path: str, title: str, wpm:
     Scene/shot markers placed at cumulative time of first element belonging to that section.
 
     FCPXML Version: 1.10 (sufficient for markers & keyword ranges).
+    out_path may be a filesystem path or a writable text stream.
     """
     import xml.etree.ElementTree as ET
     # Compute word counts for timing
     wps = max(wpm / 60.0, 1e-6)
     min_block = 1.0  # seconds minimal duration for any textual block
 
-    # Build a flattened list of timed segments
+    # Build a flattened list of timed segments, with each element's start time (the
+    # running total of the durations before it) accumulated in the same pass
     segments = []  # (index, type, text, duration_seconds)
+    start_times: List[float] = []  # indexed like elements
+    cursor = 0.0
     for idx, el in enumerate(elements):
         t = el.get("type")
         if t == "action":
             words = len(el.get("text", "").split())
         elif t == "dialogue":
-            words = len(" ".join(el.get("lines", [])).split()) + len(el.get("character"," ").split())
+            # Count per line; joining the lines first only builds a string to split again
+            words = sum(len(ln.split()) for ln in el.get("lines", [])) + len(el.get("character"," ").split())
         elif t in {"scene", "shot"}:
             # scene & shot headings negligible duration but keep a token time slice
             words = max(len(el.get("text"," ").split()), 1)
@@ -1148,12 +1410,7 @@ def write_fcpxml(elements: List[Dict[str, Any]], out_path: str, title: str, wpm:
             words = 0
         dur = max(words / wps, min_block if words>0 else 0.2)
         segments.append((idx, t, el, dur))
-
-    # Total duration and mapping index->start time
-    start_times = {}
-    cursor = 0.0
-    for idx, t, el, dur in segments:
-        start_times[idx] = cursor
+        start_times.append(cursor)
         cursor += dur
     total_seconds = cursor
 
@@ -1181,7 +1438,7 @@ def write_fcpxml(elements: List[Dict[str, Any]], out_path: str, title: str, wpm:
     shots = []  # (start_sec,dur_sec,name)
     for idx, t, el, dur in segments:
         if t == "shot":
-            shots.append((start_times[idx], dur, el.get("text", "").upper()))
+            shots.append((start_times[idx], dur, el.get("text", "")))
 
     # Minimal FCPXML structure
     fcpxml = ET.Element("fcpxml", version="1.10")
@@ -1202,6 +1459,9 @@ def write_fcpxml(elements: List[Dict[str, Any]], out_path: str, title: str, wpm:
     spine = ET.SubElement(sequence, "spine")
     # Color cycle for scene markers (visual differentiation via emoji prefix)
     color_emojis = ["🟥", "🟧", "🟨", "🟩", "🟦", "🟪"]
+    # Scenes and shots are both in start-time order and scene ranges do not overlap, so
+    # a single cursor walks the shots once across all scenes
+    shot_i = 0
 
     for i, sc in enumerate(scenes):
         sc_start = sc["start"]
@@ -1223,15 +1483,18 @@ def write_fcpxml(elements: List[Dict[str, Any]], out_path: str, title: str, wpm:
         marker_label = f"{color_emojis[i % len(color_emojis)]} {sc['name']}"
         ET.SubElement(gap, "marker", start="0s", duration="0s", value=marker_label[:255], completed="0")
         # Shots within this scene range (keywords after markers allowed, but maintain ordering)
-        for shot_start, shot_dur, shot_name in shots:
-            if sc_start <= shot_start < sc_end:
-                rel_start = max(0.0, shot_start - sc_start)
-                ET.SubElement(gap, "keyword", start=sec_to_rational(rel_start), duration=sec_to_rational(shot_dur), value=f"SHOT:{shot_name}"[:255])
+        while shot_i < len(shots) and shots[shot_i][0] < sc_start:
+            shot_i += 1
+        while shot_i < len(shots) and shots[shot_i][0] < sc_end:
+            shot_start, shot_dur, shot_name = shots[shot_i]
+            shot_i += 1
+            rel_start = max(0.0, shot_start - sc_start)
+            ET.SubElement(gap, "keyword", start=sec_to_rational(rel_start), duration=sec_to_rational(shot_dur), value=f"SHOT:{shot_name}"[:255])
 
     # Write XML
     tree = ET.ElementTree(fcpxml)
     ET.indent(tree, space="  ", level=0)  # Python 3.9+
-    with open(out_path, "w", encoding="utf-8") as f:
+    with _open_text_output(out_path) as f:
         tree.write(f, encoding="unicode")
 
     return {
@@ -1254,6 +1517,7 @@ def main():
     parser.add_argument("--shot-list-landscape", action="store_true", help="Render shot list PDF in landscape orientation")
     parser.add_argument("--vector", action="store_true", help="(Deprecated) Force vector screenplay PDF; now the default when ReportLab installed")
     parser.add_argument("--raster", action="store_true", help="Force legacy raster (image) screenplay PDF output")
+    parser.add_argument("--jobs", type=int, default=1, help="Rasterize pages in this many processes (raster mode only)")
     parser.add_argument("--shot-list-raster", action="store_true", help="Force raster shot list PDF (fallback)")
     parser.add_argument("--entities", action="store_true", help="Include extracted characters, locations, and objects in the shot list output")
     parser.add_argument("--fcpxml", default=None, help="Optional path to write a Final Cut Pro FCPXML with scene markers & shot keyword ranges")
@@ -1274,17 +1538,22 @@ def main():
     use_vector = not args.raster  # default vector
     if args.vector:
         use_vector = True
-    try:
-        if use_vector:
-            with open(args.input_md, "r", encoding="utf-8") as f:
-                md_src = f.read()
-            elements = parse_screenplay_markdown(md_src)
-            draw_pdf_vector(elements, args.output_pdf, title=title, font_path=args.font, font_size=args.size, transition_right_in=args.transition_right)
-        else:
-            elements = convert_markdown_to_pdf(args.input_md, args.output_pdf, title=title, font_path=args.font, font_size=args.size, break_style=args.break_style, transition_right_in=args.transition_right)
-    except SystemExit:  # ReportLab missing
-        # Fallback to raster if vector requested but lib unavailable
-        elements = convert_markdown_to_pdf(args.input_md, args.output_pdf, title=title, font_path=args.font, font_size=args.size, break_style=args.break_style, transition_right_in=args.transition_right)
+    # Read and parse once; the screenplay, its raster fallback and every side output
+    # (shot list, FCPXML) share the same elements
+    with open(args.input_md, "r", encoding="utf-8") as f:
+        elements = parse_screenplay_markdown(f.read())
+    render_args = dict(title=title, font_path=args.font, font_size=args.size, transition_right_in=args.transition_right)
+    fell_back = False
+    if use_vector:
+        try:
+            draw_pdf_vector(elements, args.output_pdf, **render_args)
+        except ImportError:  # ReportLab missing
+            # Fallback to raster if vector requested but lib unavailable
+            use_vector = False
+            fell_back = True
+    if not use_vector:
+        draw_pdf(elements, args.output_pdf, break_style=args.break_style, jobs=args.jobs, **render_args)
+    if fell_back:
         print("ReportLab not available, fell back to raster rendering.")
     if args.shot_list:
         write_shot_list(elements, args.shot_list, include_entities=args.entities)
@@ -1317,17 +1586,19 @@ def main():
                     root = tree.getroot()
                     # Accept typical names in order
                     preferred = ["Basic Title", "Basic", "Build In/Out", "Build In:Out"]
-                    effects = root.findall('.//resources/effect')
+                    # One pass over the effects: the first uid seen for each name, and the
+                    # first uid overall as the fallback
+                    uid_by_name: Dict[str, str] = {}
                     chosen_uid = None
+                    for eff in root.findall('.//resources/effect'):
+                        uid = eff.get('uid')
+                        if uid:
+                            uid_by_name.setdefault(eff.get('name'), uid)
+                            if chosen_uid is None:
+                                chosen_uid = uid
                     for name in preferred:
-                        for eff in effects:
-                            if eff.get('name') == name and eff.get('uid'):
-                                return eff.get('uid')
-                    # fallback first effect with uid
-                    for eff in effects:
-                        if eff.get('uid'):
-                            chosen_uid = eff.get('uid')
-                            break
+                        if name in uid_by_name:
+                            return uid_by_name[name]
                     return chosen_uid
                 resolved_uid = _detect_uid_from_xml(args.fcpxml_title_ref)
                 if resolved_uid:
@@ -1,11 +1,21 @@
 import pytest
 import io
 import time
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+from datetime import datetime
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
-from app import app
+import app as app_module
+from app import app, limiter, parse_markdown_cached, generate_pdf_cached, _pdf_cache_key, download_response, STREAM_THRESHOLD
 
 @pytest.fixture(autouse=True)
 def reset_rate_limit():
+    # Every test starts with a full request budget, whatever ran before it
+    limiter.reset()
     # Yield to run the test
     yield
     # Wait a bit between tests to avoid rate limit issues
@@ -22,6 +32,13 @@ class TestHealthEndpoint:
         assert data["status"] == "healthy"
         assert "timestamp" in data
 
+    def test_health_timestamp_reused_within_second(self):
+        first = client.get("/health").json()["timestamp"]
+        second = client.get("/health").json()["timestamp"]
+        # Second-granularity timestamps; consecutive probes normally share one
+        assert datetime.fromisoformat(first) <= datetime.fromisoformat(second)
+        assert datetime.fromisoformat(first).microsecond == 0
+
 
 class TestIndexEndpoint:
     def test_index_returns_html(self):
@@ -31,6 +48,44 @@ class TestIndexEndpoint:
         assert b"ScriptMD2PDF" in response.content
         assert b"Markdown to Screenplay" in response.content
 
+    def test_index_sets_etag_and_cache_headers(self):
+        response = client.get("/")
+        assert response.headers["etag"]
+        assert "max-age" in response.headers["cache-control"]
+
+    def test_index_not_modified_for_matching_etag(self):
+        etag = client.get("/").headers["etag"]
+        response = client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_index_served_gzipped_when_accepted(self):
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert b"<!DOCTYPE html>" in response.content
+
+    def test_index_served_plain_without_gzip(self):
+        response = client.get("/", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert b"<!DOCTYPE html>" in response.content
+
+    def test_index_not_modified_for_weak_or_listed_etag(self):
+        headers = {"Accept-Encoding": "identity"}
+        etag = client.get("/", headers=headers).headers["etag"]
+        for if_none_match in (f"W/{etag}", f'"stale", {etag}', f'"stale" , W/{etag}'):
+            response = client.get("/", headers={**headers, "If-None-Match": if_none_match})
+            assert response.status_code == 304
+        response = client.get("/", headers={**headers, "If-None-Match": '"stale", W/"other"'})
+        assert response.status_code == 200
+
+    def test_index_honors_gzip_q_values(self):
+        refused = client.get("/", headers={"Accept-Encoding": "gzip;q=0, identity"})
+        assert "content-encoding" not in refused.headers
+        refused_wildcard = client.get("/", headers={"Accept-Encoding": "*;q=0"})
+        assert "content-encoding" not in refused_wildcard.headers
+        accepted = client.get("/", headers={"Accept-Encoding": "deflate, gzip;q=0.5"})
+        assert accepted.headers["content-encoding"] == "gzip"
+
 
 class TestFileConversion:
     def test_convert_valid_markdown_file(self):
@@ -89,6 +144,44 @@ Hello, world!
         assert response.status_code == 413
         assert "exceeds" in response.json()["detail"]
 
+    def test_convert_rejects_oversized_body_before_parsing(self, monkeypatch):
+        from starlette.formparsers import MultiPartParser
+        parsed = []
+        real_parse = MultiPartParser.parse
+
+        async def spy(parser):
+            parsed.append(parser)
+            return await real_parse(parser)
+
+        monkeypatch.setattr(MultiPartParser, "parse", spy)
+        large_content = b"#" * (2 * 1048576)
+        files = {"file": ("large.md", io.BytesIO(large_content), "text/markdown")}
+
+        response = client.post("/convert", files=files, headers={"Origin": "http://example.com"})
+
+        assert response.status_code == 413
+        assert "exceeds" in response.json()["detail"]
+        # Refused from Content-Length alone, and the browser can still read the error
+        assert parsed == []
+        assert "access-control-allow-origin" in response.headers
+
+        small = {"file": ("small.md", io.BytesIO(b"### INT. A - DAY"), "text/markdown")}
+        assert client.post("/convert", files=small).status_code == 200
+        assert len(parsed) == 1
+
+    def test_app_imports_with_older_starlette_spool_attribute(self):
+        # Older Starlette names the spool threshold max_file_size instead of spool_max_size
+        script = (
+            "from starlette.formparsers import MultiPartParser as M\n"
+            "del M.spool_max_size\n"
+            "M.max_file_size = 1024 * 1024\n"
+            "import app\n"
+            "assert M.max_file_size == app.MAX_FILE_SIZE + app.MULTIPART_OVERHEAD\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], cwd=os.path.dirname(app_module.__file__),
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
     def test_convert_invalid_encoding(self):
         invalid_content = b'\xff\xfe\x00\x00'
         files = {"file": ("test.md", io.BytesIO(invalid_content), "text/markdown")}
@@ -98,6 +191,15 @@ Hello, world!
         assert response.status_code == 400
         assert "encoding" in response.json()["detail"].lower()
 
+    def test_convert_rejects_binary_content(self):
+        binary_content = b"### INT. LAB - DAY\n\n\x00\x01\x02 payload"
+        files = {"file": ("test.md", io.BytesIO(binary_content), "text/markdown")}
+
+        response = client.post("/convert", files=files)
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "File appears to be binary, not text"
+
     def test_convert_empty_file(self):
         files = {"file": ("empty.md", io.BytesIO(b""), "text/markdown")}
 
@@ -261,6 +363,99 @@ class TestContentType:
         assert "attachment" in response.headers["content-disposition"]
         assert "my_script.pdf" in response.headers["content-disposition"]
 
+    def test_pdf_filename_drops_client_directories(self):
+        md_content = b"### INT. TEST - DAY"
+        files = {"file": ("drafts/my_script.md", io.BytesIO(md_content), "text/markdown")}
+
+        response = client.post("/convert", files=files)
+
+        assert response.status_code == 200
+        assert response.headers["content-disposition"] == 'attachment; filename="my_script.pdf"'
+
+
+class TestParseCache:
+    def test_identical_markdown_reuses_elements(self):
+        md = "### INT. CACHE TEST - DAY\n\nAction."
+        first = parse_markdown_cached(md)
+        second = parse_markdown_cached(md)
+        assert first is second
+        assert first[0]["type"] == "scene"
+
+    def test_different_markdown_parsed_separately(self):
+        first = parse_markdown_cached("### INT. ONE - DAY")
+        second = parse_markdown_cached("### INT. TWO - DAY")
+        assert first is not second
+        assert second[0]["text"] == "INT. TWO - DAY"
+
+
+class TestPDFCache:
+    def test_identical_request_returns_cached_pdf(self):
+        md = "### INT. PDF CACHE - DAY\n\nAction."
+        first = asyncio.run(generate_pdf_cached(md, "Cache", 12, True))
+        second = asyncio.run(generate_pdf_cached(md, "Cache", 12, True))
+        assert first[:4] == b"%PDF"
+        assert first is second
+
+    def test_options_are_part_of_cache_key(self):
+        md = "### INT. PDF CACHE - DAY\n\nAction."
+        vector = asyncio.run(generate_pdf_cached(md, "Cache", 12, True))
+        raster = asyncio.run(generate_pdf_cached(md, "Cache", 12, False))
+        assert vector is not raster
+
+    def test_vector_request_falls_back_to_raster_without_reportlab(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "reportlab.pdfgen", None)
+        pdf = app_module.generate_pdf("### INT. NO REPORTLAB - DAY", "Fallback", 12, True)
+        assert pdf[:4] == b"%PDF"
+        assert b"Pillow" in pdf
+
+    def test_cache_key_accepts_any_int_font_size(self):
+        # Form font sizes are unbounded ints; the key must not reject any of them
+        keys = {_pdf_cache_key("md", "T", size, True) for size in (-1, 0, 12, 2**32)}
+        assert len(keys) == 4
+
+    def test_convert_with_out_of_range_font_size_renders(self):
+        files = {"file": ("test.md", io.BytesIO(b"### INT. TEST - DAY\n\nAction."), "text/markdown")}
+        response = client.post("/convert", files=files, data={"font_size": "-1", "use_vector": "true"})
+        assert response.status_code == 200
+        assert response.content[:4] == b"%PDF"
+
+
+class TestProcessPool:
+    def test_pool_recovers_after_worker_dies(self):
+        pool = app_module.get_process_pool()
+        asyncio.run(app_module.run_in_process_pool(os.getpid))
+        for pid in list(pool._processes):
+            os.kill(pid, signal.SIGKILL)
+
+        # The broken pool is replaced and the call retried instead of failing
+        worker_pid = asyncio.run(app_module.run_in_process_pool(os.getpid))
+        assert worker_pid != os.getpid()
+        assert app_module.get_process_pool() is not pool
+
+    def test_lifespan_starts_and_stops_pool(self):
+        with TestClient(app):
+            assert app_module._process_pool is not None
+        assert app_module._process_pool is None
+
+
+class TestDownloadResponse:
+    def test_small_payload_sent_in_one_body(self):
+        response = download_response(b"%PDF-small", "application/pdf", {"Content-Disposition": "attachment"})
+        assert not isinstance(response, StreamingResponse)
+        assert response.body == b"%PDF-small"
+
+    def test_large_payload_streamed_with_content_length(self):
+        payload = bytes(range(256)) * (STREAM_THRESHOLD // 256 + 10)
+        response = download_response(payload, "application/pdf", {"Content-Disposition": "attachment"})
+        assert isinstance(response, StreamingResponse)
+        assert response.headers["content-length"] == str(len(payload))
+        assert response.headers["content-disposition"] == "attachment"
+
+        async def collect():
+            return b"".join([chunk async for chunk in response.body_iterator])
+
+        assert asyncio.run(collect()) == payload
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,6 +1,9 @@
 import pytest
+import importlib.util
+import io
 import os
-import tempfile
+import sys
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from screenmd2pdf import (
     parse_screenplay_markdown,
@@ -11,9 +14,60 @@ from screenmd2pdf import (
     build_shot_list,
     extract_entities,
     write_fcpxml,
+    draw_pdf,
     draw_pdf_vector,
+    _register_ttf_family,
+    _REGISTERED_TTF,
+    _wrap_monospace,
+    _wrap_text,
+    _mono_fit,
+    _mono_advance,
+    font_metrics,
+    load_bold_variant,
 )
 
+HAS_REPORTLAB = importlib.util.find_spec("reportlab") is not None
+HAS_BENCHMARK = importlib.util.find_spec("pytest_benchmark") is not None
+
+LONG_A_ACTION = f"### INT. ROOM - DAY\n\n{'A' * 500}"
+
+INTEGRATION_MD = """### INT. COFFEE SHOP - DAY
+
+ALEX sits at a corner table, laptop open.
+
+@ALEX
+(to himself)
+Just one more line of code.
+
+The BARISTA approaches.
+
+@BARISTA
+Another refill?
+
+@ALEX
+Please. Make it a double.
+
+>> CUT TO:
+
+### EXT. STREET - LATER
+
+Alex walks home, energized.
+
+! CLOSE ON - COFFEE CUP
+
+Empty, but still warm.
+
+---
+
+### INT. ALEX'S APARTMENT - NIGHT
+
+The laptop screen glows in the darkness.
+
+@ALEX
+(typing furiously)
+Finally. It works!
+"""
+
 
 class TestMarkdownParsing:
     def test_parse_scene_heading(self):
@@ -23,15 +77,14 @@ class TestMarkdownParsing:
         assert elements[0]["type"] == "scene"
         assert elements[0]["text"] == "INT. KITCHEN - DAY"
 
-    def test_parse_scene_heading_variations(self):
-        variations = [
-            "# INT. OFFICE - DAY",
-            "## EXT. GARDEN - NIGHT",
-            "### INT/EXT. CAR - MOVING"
-        ]
-        for md in variations:
-            elements = parse_screenplay_markdown(md)
-            assert elements[0]["type"] == "scene"
+    @pytest.mark.parametrize("md", [
+        "# INT. OFFICE - DAY",
+        "## EXT. GARDEN - NIGHT",
+        "### INT/EXT. CAR - MOVING"
+    ])
+    def test_parse_scene_heading_variations(self, md):
+        elements = parse_screenplay_markdown(md)
+        assert elements[0]["type"] == "scene"
 
     def test_parse_action(self):
         md = "The sun rises over the city."
@@ -95,22 +148,8 @@ class TestMarkdownParsing:
         assert len(elements) == 1
         assert elements[0]["type"] == "action"
 
-    def test_parse_complex_screenplay(self):
-        md = """### INT. COFFEE SHOP - DAY
-
-The morning rush is in full swing.
-
-@ALEX
-(to barista)
-Large coffee, please.
-
->> CUT TO:
-
-! CLOSE ON - COFFEE CUP
-
-Steam rises from the cup.
-"""
-        elements = parse_screenplay_markdown(md)
+    def test_parse_complex_screenplay(self, complex_elements):
+        elements = complex_elements
         assert len(elements) == 6
         assert elements[0]["type"] == "scene"
         assert elements[1]["type"] == "action"
@@ -131,12 +170,12 @@ Hi there."""
 
 
 class TestFontHandling:
-    def test_find_mono_font(self):
-        font_path = find_mono_font()
+    def test_find_mono_font(self, mono_font_path):
         # May be None on systems without standard fonts
-        if font_path:
-            assert os.path.exists(font_path)
-            assert font_path.endswith(('.ttf', '.TTF'))
+        if mono_font_path:
+            assert os.path.exists(mono_font_path)
+            assert mono_font_path.endswith(('.ttf', '.TTF'))
+        assert find_mono_font() == mono_font_path
 
     def test_load_font_default(self):
         font = load_font()
@@ -150,9 +189,36 @@ class TestFontHandling:
         font = load_font(override_path="/nonexistent/font.ttf")
         assert font is not None  # Should fall back to default
 
+    def test_load_font_is_cached(self):
+        assert load_font(size=13) is load_font(size=13)
+        assert load_font(size=13) is not load_font(size=14)
+
+    def test_font_metrics_cached_per_font(self):
+        font = load_font(size=13)
+        assert font_metrics(font) == font.getmetrics()
+        before = font_metrics.cache_info().hits
+        font_metrics(font)
+        assert font_metrics.cache_info().hits == before + 1
+
+    @pytest.mark.skipif(not HAS_REPORTLAB, reason="ReportLab not installed")
+    def test_register_ttf_family_fallback_and_reuse(self, mono_font_path):
+        assert _register_ttf_family(None, "TestMono", "TestMonoBold") == ("Courier", "Courier-Bold")
+        assert _register_ttf_family("/nonexistent/font.ttf", "TestMono", "TestMonoBold") == ("Courier", "Courier-Bold")
+
+        font_path = mono_font_path
+        if not font_path:
+            pytest.skip("No monospace TTF available")
+        first = _register_ttf_family(font_path, "TestMono", "TestMonoBold")
+        assert first[0] == "TestMono"
+        assert _REGISTERED_TTF["TestMono"] == font_path
+        # Second call is served from the registry without reloading the TTF
+        assert _register_ttf_family(font_path, "TestMono", "TestMonoBold") == first
+
 
 class TestPDFGeneration:
-    def test_convert_markdown_to_pdf(self):
+    @pytest.mark.parametrize("title", ["", "Test Script"])
+    @pytest.mark.skipif(not HAS_REPORTLAB, reason="ReportLab not installed")
+    def test_convert_markdown_to_pdf(self, tmp_dir, title):
         md_content = """### INT. TEST SCENE - DAY
 
 Test action.
@@ -160,122 +226,135 @@ Test action.
 @TEST
 Test dialogue.
 """
-        with tempfile.TemporaryDirectory() as tmpdir:
-            md_path = os.path.join(tmpdir, "test.md")
-            pdf_path = os.path.join(tmpdir, "test.pdf")
+        md_path = str(tmp_dir / "test.md")
+        pdf_path = str(tmp_dir / "test.pdf")
 
-            with open(md_path, "w") as f:
-                f.write(md_content)
+        Path(md_path).write_text(md_content, encoding="utf-8")
 
-            elements = convert_markdown_to_pdf(md_path, pdf_path)
+        elements = convert_markdown_to_pdf(md_path, pdf_path, title=title)
 
-            assert os.path.exists(pdf_path)
-            assert len(elements) == 3
-            assert os.path.getsize(pdf_path) > 0
-
-    def test_convert_with_title(self):
-        md_content = "### INT. TEST - DAY"
-        with tempfile.TemporaryDirectory() as tmpdir:
-            md_path = os.path.join(tmpdir, "test.md")
-            pdf_path = os.path.join(tmpdir, "test.pdf")
-
-            with open(md_path, "w") as f:
-                f.write(md_content)
-
-            convert_markdown_to_pdf(md_path, pdf_path, title="Test Script")
-            assert os.path.exists(pdf_path)
+        assert len(elements) == 3
+        assert Path(pdf_path).stat().st_size > 0
 
-    def test_vector_pdf_generation(self):
-        try:
-            import reportlab
-            md_content = "### INT. TEST - DAY\n\nTest action."
-            elements = parse_screenplay_markdown(md_content)
+    def test_convert_falls_back_to_raster_without_reportlab(self, tmp_dir, monkeypatch):
+        # A None entry makes the import fail as if ReportLab were not installed
+        monkeypatch.setitem(sys.modules, "reportlab.pdfgen", None)
+        with pytest.raises(ImportError):
+            draw_pdf_vector(parse_screenplay_markdown("### INT. TEST - DAY"), io.BytesIO())
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                pdf_path = os.path.join(tmpdir, "test_vector.pdf")
-                draw_pdf_vector(elements, pdf_path, title="Test")
-                assert os.path.exists(pdf_path)
-                assert os.path.getsize(pdf_path) > 0
-        except ImportError:
-            pytest.skip("ReportLab not installed")
+        md_path = str(tmp_dir / "test.md")
+        pdf_path = str(tmp_dir / "test.pdf")
+        Path(md_path).write_text("### INT. TEST - DAY\n\nTest action.", encoding="utf-8")
+        elements = convert_markdown_to_pdf(md_path, pdf_path)
 
+        assert len(elements) == 2
+        assert b"Pillow" in Path(pdf_path).read_bytes()
+
+    @pytest.mark.skipif(not HAS_REPORTLAB, reason="ReportLab not installed")
+    def test_vector_pdf_generation(self, simple_elements, tmp_dir):
+        pdf_path = str(tmp_dir / "test_vector.pdf")
+        draw_pdf_vector(simple_elements, pdf_path, title="Test")
+        assert Path(pdf_path).stat().st_size > 0
+
+    @pytest.mark.skipif(not HAS_REPORTLAB, reason="ReportLab not installed")
+    def test_pdf_renderers_accept_file_like(self, simple_elements):
+        elements = simple_elements
+
+        raster_buf = io.BytesIO()
+        draw_pdf(elements, raster_buf, title="Test")
+        assert raster_buf.getvalue()[:4] == b"%PDF"
+
+        vector_buf = io.BytesIO()
+        draw_pdf_vector(elements, vector_buf, title="Test")
+        assert vector_buf.getvalue()[:4] == b"%PDF"
+
+    def test_raster_scene_heading_bold_with_default_font(self, monkeypatch):
+        from PIL import ImageDraw
+        calls = []
+        real_text = ImageDraw.ImageDraw.text
+
+        def spy(draw, xy, text, *args, **kwargs):
+            calls.append((xy, text, kwargs.get("font")))
+            return real_text(draw, xy, text, *args, **kwargs)
+
+        monkeypatch.setattr(ImageDraw.ImageDraw, "text", spy)
+        draw_pdf(parse_screenplay_markdown("### INT. TEST - DAY"), io.BytesIO())
+
+        heading = [c for c in calls if c[1] == "INT. TEST - DAY"]
+        regular = load_font()
+        path = getattr(regular, "path", None)
+        bold = load_bold_variant(regular, path if isinstance(path, str) else None, 12)
+        if bold is regular:
+            # No bold face to find: the heading is double-struck in the regular face
+            assert len(heading) == 2
+        else:
+            assert [font for _, _, font in heading] == [bold]
+
+    def test_raster_parallel_pages_match_serial(self, monkeypatch):
+        from PIL import Image
+        from PIL.PdfParser import PdfParser
+        # Pages are rasterized in the workers but saved in this process, so the pixels
+        # of every page can be captured at save time and compared in order
+        rendered = []
+        real_save = Image.Image.save
+
+        def capture(img, fp, *args, **kwargs):
+            rendered.append([page.tobytes() for page in [img, *kwargs.get("append_images", [])]])
+            return real_save(img, fp, *args, **kwargs)
+
+        monkeypatch.setattr(Image.Image, "save", capture)
+        md = "\n\n---\n\n".join(f"### INT. ROOM {i} - DAY\n\nAction {i}." for i in range(4))
+        elements = parse_screenplay_markdown(md)
+        serial, parallel = io.BytesIO(), io.BytesIO()
+        draw_pdf(elements, serial, title="Test")
+        draw_pdf(elements, parallel, title="Test", jobs=2)
+        assert len(PdfParser(buf=serial.getvalue()).pages) == 4
+        assert len(PdfParser(buf=parallel.getvalue()).pages) == 4
+        serial_pages, parallel_pages = rendered
+        blank = Image.new("L", (612, 792), 255).tobytes()
+        assert blank not in serial_pages and len(set(serial_pages)) == 4
+        assert parallel_pages == serial_pages
 
 class TestShotList:
-    def test_build_shot_list_scenes(self):
-        md = """### INT. KITCHEN - DAY
-
-Making breakfast.
-
-### EXT. GARDEN - DAY
-
-Walking through flowers.
-"""
-        elements = parse_screenplay_markdown(md)
-        rows, entities = build_shot_list(elements, include_entities=False)
+    def test_build_shot_list_scenes(self, two_scene_elements):
+        rows, entities = build_shot_list(two_scene_elements, include_entities=False)
 
         assert len(rows) == 2
         assert rows[0]["type"] == "SCENE"
         assert rows[0]["scene"] == "INT. KITCHEN - DAY"
         assert "breakfast" in rows[0]["summary"].lower()
 
-    def test_build_shot_list_with_shots(self):
-        md = """### INT. ROOM - DAY
-
-! CLOSE ON
-
-A detail shot.
-"""
-        elements = parse_screenplay_markdown(md)
-        rows, entities = build_shot_list(elements, include_entities=False)
+    def test_build_shot_list_with_shots(self, shot_elements):
+        rows, entities = build_shot_list(shot_elements, include_entities=False)
 
         assert len(rows) == 2
         assert rows[0]["type"] == "SCENE"
         assert rows[1]["type"] == "SHOT"
         assert rows[1]["shot"] == "CLOSE ON"
 
-    def test_write_shot_list_markdown(self):
-        md = "### INT. TEST - DAY\n\nTest action."
-        elements = parse_screenplay_markdown(md)
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "shots.md")
-            write_shot_list(elements, output_path, include_entities=False)
-
-            assert os.path.exists(output_path)
-            with open(output_path) as f:
-                content = f.read()
-                assert "Type" in content
-                assert "Scene" in content
-                assert "SCENE" in content
-
-    def test_write_shot_list_csv(self):
-        md = "### INT. TEST - DAY\n\nTest action."
-        elements = parse_screenplay_markdown(md)
+    @pytest.mark.parametrize("ext", [".md", ".csv"])
+    def test_write_shot_list_file(self, simple_elements, tmp_dir, ext):
+        # The format follows the output path's extension
+        out = tmp_dir / f"shots{ext}"
+        write_shot_list(simple_elements, str(out), include_entities=False)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "shots.csv")
-            write_shot_list(elements, output_path, include_entities=False)
+        content = out.read_text()
+        assert "Type" in content
+        assert "Scene" in content
+        assert "SCENE" in content
 
-            assert os.path.exists(output_path)
-            with open(output_path) as f:
-                content = f.read()
-                assert "Type" in content
-                assert "Scene" in content
+    def test_write_shot_list_to_stream(self, simple_elements):
+        buf = io.StringIO()
+        rows, entities = write_shot_list(simple_elements, buf, include_entities=False, fmt="csv")
+        assert (rows, entities) == build_shot_list(simple_elements)
+        content = buf.getvalue()
+        assert content.startswith("#,Type,Scene,Shot,Summary")
+        assert "INT. TEST - DAY" in content
 
 
 class TestEntityExtraction:
-    def test_extract_characters(self):
-        md = """@ALEX
-Hello.
-
-@JORDAN
-Hi there.
-
-@ALEX
-How are you?
-"""
-        elements = parse_screenplay_markdown(md)
-        entities = extract_entities(elements)
+    def test_extract_characters(self, dialog_elements):
+        entities = extract_entities(dialog_elements)
 
         assert "characters" in entities
         assert "ALEX" in entities["characters"]
@@ -316,76 +395,51 @@ The PHONE rings loudly.
         # Should extract uppercase nouns that aren't characters/locations
         assert any(obj in entities["objects"] for obj in ["LAPTOP", "BRIEFCASE", "PHONE"])
 
-    def test_entities_first_index(self):
-        md = """### INT. ROOM - DAY
-
-@ALEX
-Hello.
-
-@JORDAN
-Hi.
-
-@ALEX
-Bye.
-"""
-        elements = parse_screenplay_markdown(md)
-        entities = extract_entities(elements)
+    def test_entities_first_index(self, dialog_elements):
+        entities = extract_entities(dialog_elements)
 
         # ALEX appears first at index 1, JORDAN at index 2
         assert entities["characters"]["ALEX"]["first_index"] < entities["characters"]["JORDAN"]["first_index"]
 
 
 class TestFCPXMLExport:
-    def test_write_fcpxml(self):
-        try:
-            import xml.etree.ElementTree as ET
-
-            md = """### INT. SCENE ONE - DAY
+    def test_write_fcpxml(self, two_scene_elements, tmp_dir):
+        output_path = str(tmp_dir / "test.fcpxml")
+        result = write_fcpxml(two_scene_elements, output_path, title="Test Script")
 
-Action one.
+        assert result["scene_markers"] == 2
 
-### INT. SCENE TWO - DAY
+        # Validate XML structure
+        data = Path(output_path).read_bytes()
+        assert data
+        assert ET.fromstring(data).tag == "fcpxml"
 
-Action two.
-"""
-            elements = parse_screenplay_markdown(md)
-
-            with tempfile.TemporaryDirectory() as tmpdir:
-                output_path = os.path.join(tmpdir, "test.fcpxml")
-                result = write_fcpxml(elements, output_path, title="Test Script")
-
-                assert os.path.exists(output_path)
-                assert result["scene_markers"] == 2
+    def test_fcpxml_with_shots(self, shot_elements, tmp_dir):
+        output_path = str(tmp_dir / "test.fcpxml")
+        result = write_fcpxml(shot_elements, output_path, title="Test")
 
-                # Validate XML structure
-                tree = ET.parse(output_path)
-                root = tree.getroot()
-                assert root.tag == "fcpxml"
+        assert result["scene_markers"] == 1
+        assert result["shot_keywords"] == 1
 
-        except ImportError:
-            pytest.skip("XML module not available")
+    def test_write_fcpxml_to_stream(self):
+        elements = parse_screenplay_markdown("### INT. ROOM - DAY\n\nAction.")
+        buf = io.StringIO()
+        result = write_fcpxml(elements, buf, title="Test")
 
-    def test_fcpxml_with_shots(self):
-        try:
-            md = """### INT. ROOM - DAY
-
-! CLOSE ON
-
-Detail shot.
-"""
-            elements = parse_screenplay_markdown(md)
+        assert result["scene_markers"] == 1
+        assert ET.fromstring(buf.getvalue()).tag == "fcpxml"
 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                output_path = os.path.join(tmpdir, "test.fcpxml")
-                result = write_fcpxml(elements, output_path, title="Test")
+    def test_fcpxml_shots_land_in_their_scene(self):
+        md = "! OPENING\n\n### INT. ONE - DAY\n\n! WIDE\n\n! CLOSE\n\n### INT. TWO - DAY\n\n! POV"
+        buf = io.StringIO()
+        write_fcpxml(parse_screenplay_markdown(md), buf, title="Test")
 
-                assert result["scene_markers"] == 1
-                assert result["shot_keywords"] == 1
+        gaps = ET.fromstring(buf.getvalue()).iter("gap")
+        keywords = [[kw.get("value") for kw in gap.iter("keyword")] for gap in gaps]
+        # A shot before the first scene has no scene range to land in
+        assert keywords == [["SHOT:WIDE", "SHOT:CLOSE"], ["SHOT:POV"]]
 
-        except ImportError:
-            pytest.skip("XML module not available")
-
-    def test_fcpxml_timing_estimation(self):
+    def test_fcpxml_timing_estimation(self, tmp_dir):
         md = """### INT. ROOM - DAY
 
 This is a longer action paragraph with many words to test the timing estimation feature.
@@ -393,26 +447,31 @@ It should result in a longer duration based on word count and words per minute c
 """
         elements = parse_screenplay_markdown(md)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = os.path.join(tmpdir, "test.fcpxml")
-            result = write_fcpxml(elements, output_path, title="Test", wpm=160)
+        output_path = str(tmp_dir / "test.fcpxml")
+        result = write_fcpxml(elements, output_path, title="Test", wpm=160)
 
-            assert result["total_seconds"] > 0
+        assert result["total_seconds"] > 0
 
 
 class TestEdgeCases:
-    def test_empty_markdown(self):
-        elements = parse_screenplay_markdown("")
-        assert len(elements) == 0
-
-    def test_only_whitespace(self):
-        elements = parse_screenplay_markdown("   \n\n   \n")
-        assert len(elements) == 0
-
-    def test_multiple_blank_lines(self):
-        md = "### INT. ROOM - DAY\n\n\n\nAction."
+    @pytest.mark.parametrize("md,expected_types", [
+        ("", []),
+        ("   \n\n   \n", []),
+        ("### INT. ROOM - DAY\n\n\n\nAction.", ["scene", "action"]),
+        (LONG_A_ACTION, ["scene", "action"]),
+        ("### INT. ROOM - DAY\r\n\r\nAction.\n\n@ALEX\r\nHello.", ["scene", "action", "dialogue"]),
+        ("---\n\n---\n\n---", ["pagebreak", "pagebreak", "pagebreak"]),
+    ], ids=[
+        "empty_markdown",
+        "only_whitespace",
+        "multiple_blank_lines",
+        "very_long_line",
+        "mixed_line_endings",
+        "consecutive_page_breaks",
+    ])
+    def test_element_types(self, md, expected_types):
         elements = parse_screenplay_markdown(md)
-        assert len(elements) == 2
+        assert [e["type"] for e in elements] == expected_types
 
     def test_dialogue_without_lines(self):
         md = "@CHARACTER"
@@ -421,150 +480,111 @@ class TestEdgeCases:
         assert elements[0]["type"] == "dialogue"
         assert elements[0]["lines"] == []
 
-    def test_very_long_line(self):
-        long_text = "A" * 500
-        md = f"### INT. ROOM - DAY\n\n{long_text}"
-        elements = parse_screenplay_markdown(md)
-        assert len(elements) == 2
-
     def test_special_characters(self):
         md = "### INT. CAFÉ - DAY\n\n@RENÉ\nBonjour!"
         elements = parse_screenplay_markdown(md)
         assert elements[0]["text"] == "INT. CAFÉ - DAY"
         assert elements[1]["character"] == "RENÉ"
 
-    def test_mixed_line_endings(self):
-        md = "### INT. ROOM - DAY\r\n\r\nAction.\n\n@ALEX\r\nHello."
-        elements = parse_screenplay_markdown(md)
-        assert len(elements) == 3
-
-    def test_consecutive_page_breaks(self):
-        md = "---\n\n---\n\n---"
-        elements = parse_screenplay_markdown(md)
-        assert len(elements) == 3
-        assert all(e["type"] == "pagebreak" for e in elements)
-
 
+class TestMonospaceWrap:
+    def test_wraps_on_word_boundaries(self):
+        assert _wrap_monospace("one two three four", 9) == ["one two", "three", "four"]
+        # Lines that already fit keep their original spacing
+        assert _wrap_monospace("a  b", 10) == ["a  b"]
+
+    def test_hard_wraps_long_words(self):
+        assert _wrap_monospace("go " + "x" * 12, 5) == ["go", "xxxxx", "xxxxx", "xx"]
+
+    @pytest.mark.parametrize("max_width", [7.2, 72.0, 100.0, 432.0])
+    def test_mono_fit_matches_direct_measurement(self, max_width):
+        # Advance that is not exact in binary, measured the way ReportLab does
+        def width(t):
+            return len(t) * 0.6 * 12
+        n = _mono_fit(width, width("M"), max_width)
+        assert width("M" * n) <= max_width < width("M" * (n + 1))
+
+    def test_mono_advance_ignores_non_positive_sizes(self):
+        # A font_size <= 0 measures every string as <= 0; counting characters against
+        # that would never settle, so those renders take the measuring wrap
+        assert _mono_advance(lambda t: len(t) * -0.6) == 0.0
+        assert _mono_advance(lambda t: 0.0) == 0.0
+        assert _mono_advance(lambda t: len(t) * 7.2) == 7.2
+
+    def test_wrap_text_keeps_line_that_fits_exactly(self):
+        # Courier 14pt in the 252pt dialogue column: 252 // 8.4 floors to 29, yet 30 fit
+        def width(t):
+            return len(t) * 0.6 * 14
+        line = "x" * 30
+        assert width(line) <= 252
+        assert _wrap_text(line, 252, width, width("M")) == [line]
+        assert _wrap_text(line + "x", 252, width, width("M")) == [line, "x"]
+
+
+@pytest.mark.skipif(not HAS_REPORTLAB, reason="ReportLab not installed")
 class TestIntegration:
-    def test_full_screenplay_workflow(self):
-        screenplay = """### INT. COFFEE SHOP - DAY
-
-ALEX sits at a corner table, laptop open.
-
-@ALEX
-(to himself)
-Just one more line of code.
-
-The BARISTA approaches.
-
-@BARISTA
-Another refill?
-
-@ALEX
-Please. Make it a double.
-
->> CUT TO:
-
-### EXT. STREET - LATER
-
-Alex walks home, energized.
-
-! CLOSE ON - COFFEE CUP
-
-Empty, but still warm.
-
----
-
-### INT. ALEX'S APARTMENT - NIGHT
-
-The laptop screen glows in the darkness.
-
-@ALEX
-(typing furiously)
-Finally. It works!
-"""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            md_path = os.path.join(tmpdir, "screenplay.md")
-            pdf_path = os.path.join(tmpdir, "screenplay.pdf")
-            shots_path = os.path.join(tmpdir, "shots.md")
-            fcpxml_path = os.path.join(tmpdir, "screenplay.fcpxml")
+    def test_full_screenplay_workflow(self, tmp_path_factory):
+        tmp_dir = tmp_path_factory.mktemp("integ")
+        md_path = str(tmp_dir / "screenplay.md")
+        pdf_path = str(tmp_dir / "screenplay.pdf")
+        shots_path = str(tmp_dir / "shots.md")
+        fcpxml_path = str(tmp_dir / "screenplay.fcpxml")
 
-            with open(md_path, "w") as f:
-                f.write(screenplay)
+        Path(md_path).write_text(INTEGRATION_MD, encoding="utf-8")
 
-            # Generate PDF
-            elements = convert_markdown_to_pdf(md_path, pdf_path, title="Test Screenplay")
-            assert os.path.exists(pdf_path)
+        # Generate PDF
+        elements = convert_markdown_to_pdf(md_path, pdf_path, title="Test Screenplay")
+        assert Path(pdf_path).stat().st_size > 0
 
-            # Generate shot list
-            write_shot_list(elements, shots_path, include_entities=True)
-            assert os.path.exists(shots_path)
+        # Generate shot list
+        _, entities = write_shot_list(elements, shots_path, include_entities=True)
+        assert Path(shots_path).stat().st_size > 0
 
-            # Generate FCPXML
-            write_fcpxml(elements, fcpxml_path, title="Test Screenplay")
-            assert os.path.exists(fcpxml_path)
+        # Generate FCPXML
+        write_fcpxml(elements, fcpxml_path, title="Test Screenplay")
+        assert Path(fcpxml_path).stat().st_size > 0
 
-            # Verify entity extraction
-            entities = extract_entities(elements)
-            assert "ALEX" in entities["characters"]
-            assert "BARISTA" in entities["characters"]
-            assert entities["characters"]["ALEX"]["count"] == 3
+        # Verify entity extraction, reusing the shot list's inventory
+        assert "ALEX" in entities["characters"]
+        assert "BARISTA" in entities["characters"]
+        assert entities["characters"]["ALEX"]["count"] == 3
 
 
 class TestShotListPDF:
-    def test_render_shot_list_pdf(self):
+    @pytest.mark.parametrize("landscape,include_entities", [
+        (False, False),
+        (True, False),
+        (False, True),
+    ], ids=["portrait", "landscape", "with_entities"])
+    def test_render_shot_list_pdf(self, complex_elements, tmp_dir, landscape, include_entities):
         from screenmd2pdf import render_shot_list_pdf
 
-        md = """### INT. ROOM - DAY
-
-Action here.
+        rows, entities = build_shot_list(complex_elements, include_entities=include_entities)
 
-! CLOSE ON
-
-Detail.
-"""
-        elements = parse_screenplay_markdown(md)
-        rows, entities = build_shot_list(elements, include_entities=False)
+        pdf_path = str(tmp_dir / "shotlist.pdf")
+        render_shot_list_pdf(rows, entities, pdf_path, title="Shot List",
+                             include_entities=include_entities, landscape=landscape)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pdf_path = os.path.join(tmpdir, "shotlist.pdf")
-            render_shot_list_pdf(rows, entities, pdf_path, title="Shot List")
-
-            assert os.path.exists(pdf_path)
-            assert os.path.getsize(pdf_path) > 0
-
-    def test_render_shot_list_pdf_landscape(self):
-        from screenmd2pdf import render_shot_list_pdf
-
-        md = "### INT. ROOM - DAY\n\nAction."
-        elements = parse_screenplay_markdown(md)
-        rows, entities = build_shot_list(elements, include_entities=False)
+        assert Path(pdf_path).stat().st_size > 0
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pdf_path = os.path.join(tmpdir, "shotlist_landscape.pdf")
-            render_shot_list_pdf(rows, entities, pdf_path, title="Shot List", landscape=True)
 
-            assert os.path.exists(pdf_path)
+@pytest.mark.skipif(not HAS_BENCHMARK, reason="pytest-benchmark not installed")
+class TestBenchmarks:
+    # Run with `make bench`; the main test lane passes --benchmark-skip.
+    # A feature-length input so quadratic regressions show up in the numbers.
+    BENCH_MD = "\n".join([INTEGRATION_MD] * 25)
 
-    def test_render_shot_list_pdf_with_entities(self):
-        from screenmd2pdf import render_shot_list_pdf
-
-        md = """### INT. ROOM - DAY
-
-@ALEX
-Hello.
-
-@JORDAN
-Hi.
-"""
-        elements = parse_screenplay_markdown(md)
-        rows, entities = build_shot_list(elements, include_entities=True)
+    def test_bench_parse(self, benchmark):
+        elements = benchmark(parse_screenplay_markdown, self.BENCH_MD)
+        assert len(elements) == 25 * len(parse_screenplay_markdown(INTEGRATION_MD))
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pdf_path = os.path.join(tmpdir, "shotlist_entities.pdf")
-            render_shot_list_pdf(rows, entities, pdf_path, title="Shot List", include_entities=True)
+    def test_bench_extract_entities(self, benchmark):
+        entities = benchmark(extract_entities, parse_screenplay_markdown(self.BENCH_MD))
+        assert entities["characters"]["ALEX"]["count"] == 75
 
-            assert os.path.exists(pdf_path)
+    def test_bench_build_shot_list(self, benchmark):
+        rows, _ = benchmark(build_shot_list, parse_screenplay_markdown(self.BENCH_MD), include_entities=True)
+        assert len(rows) == 25 * 4
 
 
 if __name__ == "__main__":